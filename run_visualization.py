@@ -58,22 +58,26 @@ def main():
         print("\n✅ Analysis complete!")
         print()
         
-        # Print summary
-        print("=" * 80)
-        print("ANALYSIS SUMMARY")
-        print("=" * 80)
-        print(f"Embeddings analyzed: {len(full_results['embeddings'])}")
-        print(f"Clusters: {full_results['clustering_results']['n_clusters']}")
-        print(f"Silhouette score: {full_results['clustering_results']['silhouette_score']:.3f}")
-        print(f"Average cluster purity: {full_results['clustering_results']['average_purity']:.3f}")
-        
+        # Print summary as a single buffered write instead of one
+        # syscall-per-line print
+        summary_lines = [
+            "=" * 80,
+            "ANALYSIS SUMMARY",
+            "=" * 80,
+            f"Embeddings analyzed: {len(full_results['embeddings'])}",
+            f"Clusters: {full_results['clustering_results']['n_clusters']}",
+            f"Silhouette score: {full_results['clustering_results']['silhouette_score']:.3f}",
+            f"Average cluster purity: {full_results['clustering_results']['average_purity']:.3f}",
+        ]
+
         if full_results['query_results']:
             stats = full_results['query_results']['statistics']
-            print(f"Query hits: {stats['total_unique_hits']} unique chunks")
-            print(f"Avg hits per query: {stats['avg_hits_per_query']:.1f}")
-        
-        print(f"Figures generated: {len(full_results['figures'])}")
-        print()
+            summary_lines.append(f"Query hits: {stats['total_unique_hits']} unique chunks")
+            summary_lines.append(f"Avg hits per query: {stats['avg_hits_per_query']:.1f}")
+
+        summary_lines.append(f"Figures generated: {len(full_results['figures'])}")
+        summary_lines.append("")
+        sys.stdout.write('\n'.join(summary_lines) + '\n')
         
         # Save all figures as HTML
         print("💾 Saving visualizations...")
@@ -146,21 +150,26 @@ def main():
             json.dump(run_info, f, indent=2)
         print(f"   ✓ Saved: run_info.json")
         
-        print()
-        print("=" * 80)
-        print("✅ ALL RESULTS SAVED SUCCESSFULLY!")
-        print("=" * 80)
-        print()
-        print(f"📂 Output directory: {output_dir}")
-        print()
-        print("Files created:")
-        print(f"  📊 Figures: {figures_dir}/ (HTML files)")
-        print(f"  📄 Reports: analysis_report.txt, analysis_results.json")
-        print(f"  📈 Summary: summary_stats.json, run_info.json")
-        print()
-        print("To view visualizations:")
-        print(f"  Open any HTML file in {figures_dir}/ in your web browser")
-        print()
+        # Emoji only on a real terminal; piped output stays plain ASCII
+        emoji = sys.stdout.isatty()
+        final_lines = [
+            "",
+            "=" * 80,
+            ("✅ " if emoji else "") + "ALL RESULTS SAVED SUCCESSFULLY!",
+            "=" * 80,
+            "",
+            f"{'📂 ' if emoji else ''}Output directory: {output_dir}",
+            "",
+            "Files created:",
+            f"  {'📊 ' if emoji else ''}Figures: {figures_dir}/ (HTML files)",
+            f"  {'📄 ' if emoji else ''}Reports: analysis_report.txt, analysis_results.json",
+            f"  {'📈 ' if emoji else ''}Summary: summary_stats.json, run_info.json",
+            "",
+            "To view visualizations:",
+            f"  Open any HTML file in {figures_dir}/ in your web browser",
+            "",
+        ]
+        sys.stdout.write('\n'.join(final_lines) + '\n')
         
         # Clean up
         analyzer.close()
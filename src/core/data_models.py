@@ -25,7 +25,7 @@ class StudyDesign(Enum):
     META_ANALYSIS = "meta_analysis"
 
 
-@dataclass
+@dataclass(slots=True)
 class RawCochraneData:
     """Raw input data from Cochrane JSON files."""
     url: str
@@ -41,7 +41,7 @@ class RawCochraneData:
     full_content: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of file validation."""
     is_valid: bool
@@ -49,7 +49,7 @@ class ValidationResult:
     warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CleanedContent:
     """Content after cleaning and standardization."""
     title: str
@@ -62,7 +62,7 @@ class CleanedContent:
     url: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionContent:
     """Individual section content."""
     name: str
@@ -70,7 +70,7 @@ class SectionContent:
     subsections: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSections:
     """Hierarchically extracted sections."""
     sections: Dict[str, SectionContent] = field(default_factory=dict)
@@ -78,7 +78,7 @@ class ExtractedSections:
     subsection_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PicoElements:
     """PICO elements extracted from content."""
     population: List[str] = field(default_factory=list)
@@ -89,7 +89,7 @@ class PicoElements:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class MedicalEntities:
     """Medical entities extracted from content."""
     conditions: List[str] = field(default_factory=list)
@@ -98,7 +98,7 @@ class MedicalEntities:
     outcomes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedMetadata:
     """Enhanced metadata for processed content."""
     source_file: str
@@ -119,23 +119,24 @@ class EnrichedMetadata:
     full_content: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDocument:
     """Final processed document structure."""
     metadata: EnrichedMetadata
     sections: ExtractedSections
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of document processing."""
     success: bool
     document: Optional[ProcessedDocument] = None
     errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     processing_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStats:
     """Processing statistics."""
     total_processed: int = 0
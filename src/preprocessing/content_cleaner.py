@@ -5,44 +5,108 @@ This module handles cleaning and standardization of raw content,
 following single responsibility principle.
 """
 
-import re
+try:
+    # API-compatible drop-in with a faster matcher than stdlib re
+    import regex as re
+except ImportError:
+    import re
 from typing import List
 from src.core.data_models import RawCochraneData, CleanedContent, QualityGrade
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Plain-literal navigation strings, scanned in a single Aho-Corasick pass.
+_LITERAL_NAV_PATTERNS = [
+    'Download PDF',
+    'Comment',
+    'Share',
+    'Sign up to email alerts',
+    'Citations',
+    'Full text views:',
+    'Figures and tables',
+    'References',
+    'Supplementary materials',
+    'Search strategies',
+    'Characteristics of studies',
+    'Analyses',
+    'Download data',
+    'Related',
+    'Cochrane Clinical Answers',
+    'Editorials',
+    'Audio summaries',
+    'Special Collections',
+    'About this review',
+    'Information',
+    'Authors',
+    'Version history',
+    'Keywords (MeSH, PICOs)',
+    'Related content',
+    'Translation notes',
+    'Request permissions',
+    'Request data reuse'
+]
+
+# Patterns that genuinely need a regex engine.
+_REGEX_NAV_PATTERNS = [
+    re.compile(r'Contents\s*\n', re.IGNORECASE),  # Only remove TOC entries, not actual sections
+]
+
+
+def _build_nav_automaton():
+    """Build the Aho-Corasick automaton over the lowercased literals."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, literal in enumerate(_LITERAL_NAV_PATTERNS):
+        automaton.add_word(literal.lower(), (index, len(literal)))
+    automaton.make_automaton()
+    return automaton
+
+
+_NAV_AUTOMATON = _build_nav_automaton()
+
+# Single fused alternation over every navigation pattern, for short inputs
+# (titles) where one regex pass beats the automaton + stitch machinery.
+# The atomic group (?>...) forbids backtracking into the alternation.
+_NAV_RE = re.compile(
+    '(?>'
+    + '|'.join([re.escape(p) for p in _LITERAL_NAV_PATTERNS] + [r'Contents\s*\n'])
+    + ')',
+    re.IGNORECASE
+)
+
+
+def _strip_literal_navigation(text: str) -> str:
+    """Remove all literal navigation strings in one linear scan."""
+    lowered = text.lower()
+    spans = []
+    for end, (_, length) in _NAV_AUTOMATON.iter_long(lowered):
+        start = end - length + 1
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], end + 1)
+        else:
+            spans.append((start, end + 1))
+    if not spans:
+        return text
+    pieces = []
+    previous_end = 0
+    for start, end in spans:
+        pieces.append(text[previous_end:start])
+        previous_end = end
+    pieces.append(text[previous_end:])
+    return ''.join(pieces)
+
 
 class ContentCleaner:
     """Cleans and standardizes raw Cochrane content."""
-    
+
     # Navigation and TOC patterns to remove
-    NAVIGATION_PATTERNS = [
-        r'Download PDF',
-        r'Comment',
-        r'Share',
-        r'Sign up to email alerts',
-        r'Citations',
-        r'Full text views:.*?',
+    NAVIGATION_PATTERNS = [re.escape(p) for p in _LITERAL_NAV_PATTERNS] + [
         r'Contents\s*\n',  # Only remove TOC entries, not actual sections
-        r'Figures and tables',
-        r'References',
-        r'Supplementary materials',
-        r'Search strategies',
-        r'Characteristics of studies',
-        r'Analyses',
-        r'Download data',
-        r'Related',
-        r'Cochrane Clinical Answers',
-        r'Editorials',
-        r'Audio summaries',
-        r'Special Collections',
-        r'About this review',
-        r'Information',
-        r'Authors',
-        r'Version history',
-        r'Keywords \(MeSH, PICOs\)',
-        r'Related content',
-        r'Translation notes',
-        r'Request permissions',
-        r'Request data reuse'
     ]
     
     def clean_content(self, raw_data: RawCochraneData) -> CleanedContent:
@@ -76,14 +140,13 @@ class ContentCleaner:
         """Clean and standardize title."""
         if not title:
             return ""
-        
-        # Remove extra whitespace and normalize
-        cleaned = re.sub(r'\s+', ' ', title.strip())
-        
+
+        # split()/join normalizes all whitespace in C, no regex dispatch
+        cleaned = ' '.join(title.split())
+
         # Remove any navigation elements that might have leaked in
-        for pattern in self.NAVIGATION_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
+        cleaned = _NAV_RE.sub('', cleaned)
+
         return cleaned.strip()
     
     def _clean_abstract(self, abstract: str) -> str:
@@ -160,11 +223,17 @@ class ContentCleaner:
     
     def _remove_navigation_elements(self, text: str) -> str:
         """Remove navigation and TOC elements from text."""
-        cleaned = text
-        
-        for pattern in self.NAVIGATION_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
+        if _NAV_AUTOMATON is not None:
+            cleaned = _strip_literal_navigation(text)
+        else:
+            # Fallback when pyahocorasick is not installed
+            cleaned = text
+            for literal in _LITERAL_NAV_PATTERNS:
+                cleaned = re.sub(re.escape(literal), '', cleaned, flags=re.IGNORECASE)
+
+        for pattern in _REGEX_NAV_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
+
         return cleaned
     
     def _find_content_start(self, text: str) -> int:
@@ -4,70 +4,521 @@ Provides common functionality and defines the contract for section extraction.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 import re
 from src.core.data_models import SectionContent
 
+try:
+    # RE2's DFA scans in linear time; the .*? DOTALL scrubbers below can go
+    # quadratic in the backtracking stdlib engine on large documents
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _compile_scrubbers(patterns):
+    """Compile DOTALL+IGNORECASE scrub patterns, preferring re2 over re."""
+    compiled = []
+    for pattern in patterns:
+        if re2 is not None:
+            try:
+                compiled.append(re2.compile('(?is)' + pattern))
+                continue
+            except re2.error:
+                pass
+        compiled.append(re.compile(pattern, re.DOTALL | re.IGNORECASE))
+    return compiled
+
+
+def _compile_combined_scrubber(patterns):
+    """Fuse scrub patterns into one alternation so one pass replaces N."""
+    combined = '|'.join('(?:%s)' % p for p in patterns)
+    if re2 is not None:
+        try:
+            return re2.compile('(?is)' + combined)
+        except re2.error:
+            pass
+    return re.compile(combined, re.DOTALL | re.IGNORECASE)
+
+
+# Common navigation elements stripped by _clean_content, fused into a single
+# alternation at import; order matches the old sequential sub chain
+_NAV_COMBINED_RE = _compile_combined_scrubber((
+    r'Download PDF.*?Share',
+    r'Cite this review.*?Full text views:.*?\d+',
+    r'Contents\s*\n.*?Related\n',
+    r'Cochrane Clinical Answers.*?Request data reuse',
+    r'Browse Publications.*?Cookie Preferences',
+    r'Copyright ©.*?Cookie Preferences',
+    r'Skip to.*?Sign In',
+    r'Trusted evidence.*?Basic Search',
+    r'Unlock the full review.*?Cookie P'
+))
+
+# Pre-bound for the hot path
+_NAV_COMBINED_SUB = _NAV_COMBINED_RE.sub
+
+# Whitespace normalization: one pass collapses both newline runs (to a
+# single '\n') and space/tab runs (to a single ' ')
+_WS_COLLAPSE_RE = re.compile(r'(\n)\s*\n|[ \t]+')
+
+
+def _ws_collapse(match):
+    return match.group(1) or ' '
+
+# Enhanced patterns for better section detection (filled with the escaped
+# section name by _start_patterns)
+_START_PATTERN_FMTS = (
+    # Standard patterns
+    r'^%s\s*\n',
+    r'%s\s*\n(?:available in\s*\n)?',
+    r'%s\s*\n[A-Z]',
+    r'%s[:\s]*[A-Z]',
+    # Additional patterns for better coverage
+    r'\n%s\s*\n',
+    r'\n%s\s*\n(?:available in\s*\n)?',
+    r'\n%s\s*\n[A-Z]',
+    r'\n%s[:\s]*[A-Z]',
+    # Pattern for sections that might be followed by specific text
+    r'%s\s*\n(?:available in\s*\n)?(?:English|Español|Français)',
+    # Pattern for sections that might have extra whitespace
+    r'%s\s+\n',
+    r'\n%s\s+\n'
+)
+
+# Content-section patterns used for Methods/Results/Background/Objectives to
+# distinguish the real section from navigation/TOC entries
+_CONTENT_PATTERN_FMTS = (
+    # Methods content patterns
+    r'%s\s*\n(?:Criteria for considering studies|Types of studies|Search methods|Data collection)',
+    # Results content patterns
+    r'%s\s*\n(?:Description of studies|Results of the search|Included studies|Excluded studies)',
+    # Background content patterns - distinguish from Abstract subsections
+    r'%s\s*\n(?:Description of the condition|The extrauterine|Why it is important)',
+    # Objectives content patterns - the standalone section comes after Background
+    r'%s\s*\n(?:To determine|To assess|To evaluate|To compare|To review|To investigate).*?\n(?=Methods)',
+    # General pattern for content sections
+    r'%s\s*\n[A-Z][a-z].*?(?:\n[A-Z][a-z]|\n[A-Z][a-z][a-z])'
+)
+
+# Note: the extraction pipeline deliberately stays on str rather than bytes.
+# Cochrane content is almost entirely ASCII, which CPython already stores at
+# one byte per character (PEP 393), so a bytes port would not reduce the
+# bytes scanned — but it would break IGNORECASE for the non-ASCII language
+# labels below and risk slicing UTF-8 sequences mid-codepoint.
+
+# Language list used to spot the actual Plain Language Summary content section
+_PLS_LANGUAGES = (
+    r'(?:English|Español|Français|简体中文|繁體中文|한국어|日本語|Bahasa Malaysia|'
+    r'Polski|Română|Русский|ภาษาไทย|فارسی)'
+)
+
+# All major section names, in order of appearance
+_ALL_SECTIONS = (
+    'Abstract', 'PICOs', 'Plain language summary', 'Authors\' conclusions',
+    'Summary of findings', 'Background', 'Objectives', 'Methods', 'Results', 'Discussion'
+)
+
+def _build_header_automaton():
+    """Build the Aho-Corasick automaton over the lowercased section names."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name in _ALL_SECTIONS:
+        lowered = name.lower()
+        automaton.add_word(lowered, (lowered, len(lowered)))
+    automaton.make_automaton()
+    return automaton
+
+
+_HEADER_AC = _build_header_automaton()
+
+
+@lru_cache(maxsize=8)
+def _lowered(content: str) -> str:
+    """
+    Lowercased copy of a document, computed once and shared.
+
+    Matching case-sensitively against the lowered copy avoids the per-
+    character casefold the regex engine pays under IGNORECASE; ASCII
+    headers keep 1:1 position mapping back into the original content.
+    """
+    return content.lower()
+
+
+@lru_cache(maxsize=8)
+def _locate_section_headers(content: str) -> Dict[str, tuple]:
+    """
+    Locate every occurrence of a major section name in one linear pass.
+
+    Returns a dict mapping lowercased section name to the tuple of start
+    positions where it occurs. Cached per content string so the ten
+    extractors share a single scan of the same document.
+    """
+    lowered = _lowered(content)
+    occurrences: Dict[str, list] = {}
+    if _HEADER_AC is not None:
+        for end, (name, length) in _HEADER_AC.iter(lowered):
+            occurrences.setdefault(name, []).append(end - length + 1)
+    else:
+        # Fallback: one C-level find loop per section name
+        for section in _ALL_SECTIONS:
+            name = section.lower()
+            idx = lowered.find(name)
+            while idx != -1:
+                occurrences.setdefault(name, []).append(idx)
+                idx = lowered.find(name, idx + 1)
+    return {name: tuple(positions) for name, positions in occurrences.items()}
+
+
+# One combined next-section boundary alternation: a single scan over the tail
+# replaces the old per-section x per-pattern re.search loops
+_NEXT_SECTION_RE = re.compile(
+    r'\n(?P<sec>' + '|'.join(re.escape(s) for s in _ALL_SECTIONS) + r')'
+    r'\s*\n(?:available in\s*\n)?',
+    re.IGNORECASE
+)
+
+# Which section names are valid "next section" boundaries for the sections
+# whose subsections could otherwise be confused with major headers
+_NEXT_SECTION_ALLOWED = {
+    'objectives': frozenset(('background', 'methods', 'results', 'discussion')),
+}
+
+# For everything else: every other section name, precomputed per section
+_GENERIC_NEXT_ALLOWED = {
+    s.lower(): frozenset(x.lower() for x in _ALL_SECTIONS if x.lower() != s.lower())
+    for s in _ALL_SECTIONS
+}
+
+# Methods and Results stop at a fixed set of true major headers, so a single
+# restricted alternation search replaces the finditer + allowed-set filter
+_SECTION_END_RES = {
+    'methods': re.compile(
+        r"\n(?:Results|Discussion|Authors' conclusions|Summary of findings)"
+        r'\s*\n(?:available in\s*\n)?',
+        re.IGNORECASE
+    ),
+    'results': re.compile(
+        r"\n(?:Discussion|Authors' conclusions|Summary of findings)"
+        r'\s*\n(?:available in\s*\n)?',
+        re.IGNORECASE
+    ),
+}
+
+# The literal names behind _SECTION_END_RES, for the cheap presence check
+# that skips the boundary search when none of them occur after start_pos
+_SECTION_END_NAMES = {
+    'methods': ('results', 'discussion', "authors' conclusions", 'summary of findings'),
+    'results': ('discussion', "authors' conclusions", 'summary of findings'),
+}
+
+# Major sections that come after Plain Language Summary, with content shapes
+# that distinguish them from PLS subsections
+_PLS_END_RES = tuple(
+    re.compile(p, re.MULTILINE | re.IGNORECASE | re.DOTALL) for p in (
+        # Summary of findings - look for table content
+        r'\nSummary of findings\s*\n(?:Open in|Summary of findings\s+\d+)',
+        # Authors' conclusions - look for it appearing as a major section with specific content
+        r'\nAuthors\' conclusions\s*\n(?:Implications for|At present)',
+        # Background - look for it with specific subsections that don't exist in PLS
+        r'\nBackground\s*\n(?:Description of the condition|The extrauterine|Why it is important)',
+        # Objectives - look for it followed by Methods
+        r'\nObjectives\s*\n(?:To determine).*?\n(?=Methods)',
+        # Methods - look for standard Methods subsections
+        r'\nMethods\s*\n(?:Criteria for considering|Types of studies|Search methods)',
+        # Results - look for standard Results subsections
+        r'\nResults\s*\n(?:Description of studies|Results of the search|Included studies)',
+        # Discussion - look for it as the last major section
+        r'\nDiscussion\s*\n[A-Z][a-z].*\n(?:Summary of main results|Overall completeness|Quality of the evidence|Potential biases)'
+    )
+)
+
+# End markers that indicate the end of the Discussion section. These are
+# plain literals, so they are scanned case-sensitively against the shared
+# lowered copy of the document instead of through IGNORECASE regexes.
+_DISCUSSION_END_LITERALS = tuple(m.lower() for m in (
+    'Figures and tables',
+    'References',
+    'Supplementary materials',
+    'Search strategies',
+    'Characteristics of studies',
+    'Analyses',
+    'Download data',
+    'Related',
+    'Cochrane Clinical Answers',
+    'Editorials',
+    'Audio summaries',
+    'Special Collections',
+    'About this review',
+    'Information',
+    'Authors',
+    'Version history',
+    'Keywords',
+    'Related content',
+    'Translation notes',
+    'Request permissions',
+    'Request data reuse'
+))
+
+# Dispatch table for sections whose end is found with bespoke pattern sets:
+# Plain Language Summary stops at content-shaped major headers (Discussion
+# has its own literal-scan branch in _find_section_end)
+_SPECIAL_END_RES = {
+    'plain language summary': _PLS_END_RES,
+}
+
+# Subsection start/boundary patterns used by _extract_subsection_content
+_SUBSECTION_START_FMTS = (
+    r'^%s\s*\n',
+    r'%s\s*\n(?:available in\s*\n)?',
+    r'%s\s*\n[A-Z]',
+    r'%s[:\s]*[A-Z]'
+)
+
+def _compile_all(fmts, name, flags=re.MULTILINE | re.IGNORECASE):
+    """Compile every format in fmts with the escaped name substituted in."""
+    escaped = re.escape(name)
+    return tuple(re.compile(fmt % escaped, flags) for fmt in fmts)
+
+
+@lru_cache(maxsize=64)
+def _start_patterns(section_name):
+    """Compiled section-start patterns for a section name not known at import."""
+    return _compile_all(_START_PATTERN_FMTS, section_name)
+
+
+@lru_cache(maxsize=64)
+def _content_section_patterns(section_name):
+    """Compiled content-section patterns for a section name not known at import."""
+    return _compile_all(
+        _CONTENT_PATTERN_FMTS, section_name,
+        re.MULTILINE | re.IGNORECASE | re.DOTALL
+    )
+
+
+# All section names are known at import, so escape once and assemble the full
+# pattern dicts here; the lru_cache'd helpers above only cover stray names
+_ESCAPED_SECTION_NAMES = {s: re.escape(s) for s in _ALL_SECTIONS}
+
+_START_PATTERNS = {s: _start_patterns(s) for s in _ALL_SECTIONS}
+
+_CONTENT_SECTION_PATTERNS = {
+    s: _content_section_patterns(s)
+    for s in ('Methods', 'Results', 'Background', 'Objectives')
+}
+
+# Pattern locating the actual Plain Language Summary content section
+_PLS_CONTENT_RE = re.compile(
+    rf"{_ESCAPED_SECTION_NAMES['Plain language summary']}\s*\n(?:available in\s*\n)?{_PLS_LANGUAGES}",
+    re.MULTILINE | re.IGNORECASE
+)
+
+
+def _any_section_after(content: str, names, start_pos: int) -> bool:
+    """
+    Cheap gate from the shared linear header scan: is any of the given
+    section names present after start_pos at all? Saves the boundary regex
+    pass entirely when the answer is no.
+    """
+    occurrences = _locate_section_headers(content)
+    for name in names:
+        positions = occurrences.get(name)
+        if positions and positions[-1] > start_pos:
+            return True
+    return False
+
+
+def _find_next_section_boundary(content: str, start_pos: int, allowed) -> Optional[int]:
+    """Find the earliest allowed next-section header after start_pos.
+
+    Runs the combined alternation once over the tail (via pos=, no slice copy)
+    and returns the absolute position of the first header whose name is in
+    allowed, or None if no boundary is found.
+    """
+    for match in _NEXT_SECTION_RE.finditer(content, start_pos):
+        if match.group('sec').lower() in allowed:
+            return match.start()
+    return None
+
+
+@lru_cache(maxsize=256)
+def _subsection_start_patterns(normalized_name):
+    """Compiled start patterns for a subsection name."""
+    return _compile_all(_SUBSECTION_START_FMTS, normalized_name)
+
+
+@lru_cache(maxsize=256)
+def _subsection_next_combined(next_subsection_names: tuple):
+    """
+    One combined boundary regex for a tuple of next-subsection names.
+
+    Each parent section's subsection order is fixed, so the alternation for
+    every "remaining subsections" tail is assembled and compiled exactly
+    once and shared across documents.
+    """
+    alternation = '|'.join(
+        re.escape(name.replace('_', ' ')) for name in next_subsection_names
+    )
+    return re.compile(
+        rf'^(?:{alternation})\s*\n'
+        rf'|(?:{alternation})\s*\n[A-Z]'
+        rf'|(?:{alternation})[:\s]*[A-Z]',
+        re.MULTILINE | re.IGNORECASE
+    )
+
+
+def _trimmed_slice(text: str, lo: int, hi: int) -> str:
+    """
+    Slice text[lo:hi] with surrounding whitespace trimmed by index.
+
+    Equivalent to text[lo:hi].strip() but moves the bounds first and
+    slices once, so no intermediate untrimmed string is allocated.
+    """
+    while lo < hi and text[lo].isspace():
+        lo += 1
+    while hi > lo and text[hi - 1].isspace():
+        hi -= 1
+    return text[lo:hi]
+
+
+@lru_cache(maxsize=1)
+def warmup() -> None:
+    """
+    Run every module-level pattern once against a tiny probe string.
+
+    re2 builds its DFA lazily on first use (and the stdlib engine touches
+    per-pattern state the same way), so forcing one match here moves that
+    cost out of the first document processed. Idempotent via lru_cache.
+    """
+    probe = '\nMethods\nResults\nPlain language summary\n'
+    for pattern in (_NAV_COMBINED_RE, _WS_COLLAPSE_RE, _NEXT_SECTION_RE, _PLS_CONTENT_RE):
+        pattern.search(probe)
+    for patterns in _START_PATTERNS.values():
+        for pattern in patterns:
+            pattern.search(probe)
+    for patterns in _CONTENT_SECTION_PATTERNS.values():
+        for pattern in patterns:
+            pattern.search(probe)
+    for pattern in _PLS_END_RES:
+        pattern.search(probe)
+    for pattern in _SECTION_END_RES.values():
+        pattern.search(probe)
+
+
+@lru_cache(maxsize=64)
+def _subsection_automaton(normalized_names: tuple):
+    """
+    Aho-Corasick automaton over a parent section's subsection names.
+
+    One linear DFA sweep answers "does any subsection header occur, and
+    where does the first one start?" before the union regex runs. (A
+    Hyperscan database was considered for this, but the project already
+    depends on pyahocorasick and Hyperscan is x86-only.)
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name in normalized_names:
+        automaton.add_word(name, len(name))
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=64)
+def _subsection_union_pattern(normalized_names: tuple):
+    """
+    One union regex over every subsection header variant for a parent
+    section, so a single finditer pass locates all subsection boundaries.
+
+    Alternative order matters: the line-anchored and capital-followed
+    variants come first so a hit reports the most specific form it
+    satisfies; the bare `name\\s*\\n` form is the fallback and is used for
+    start positions only, never as an end boundary.
+    """
+    alternation = '|'.join(re.escape(name) for name in normalized_names)
+    return re.compile(
+        rf'^(?P<h1>{alternation})\s*\n'
+        rf'|(?P<h3>{alternation})\s*\n[A-Z]'
+        rf'|(?P<h4>{alternation})[:\s]*[A-Z]'
+        rf'|(?P<h2>{alternation})\s*\n(?:available in\s*\n)?',
+        re.MULTILINE | re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=8)
+def _clean_content_cached(content: str) -> str:
+    """
+    Cached cleaning pass shared by every extractor.
+
+    Each of the ten extractors cleans the same document; memoizing on the
+    content string means the substitutions run once per document instead of
+    once per extractor.
+    """
+    # Remove common navigation elements in one alternation pass
+    cleaned = _NAV_COMBINED_SUB('', content)
+
+    # Normalize whitespace in a single pass
+    cleaned = _WS_COLLAPSE_RE.sub(_ws_collapse, cleaned)
+
+    return cleaned.strip()
+
 
 class BaseSectionExtractor(ABC):
     """Base class for all section extractors."""
-    
+
     @abstractmethod
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str,
+                index: Optional[Dict[str, Tuple[int, int]]] = None) -> Optional[SectionContent]:
         """
         Extract the section from content.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index mapping lowercased section
+                names to (start, end) spans in the cleaned content
+
         Returns:
             SectionContent if found, None otherwise
         """
         pass
-    
+
     @abstractmethod
     def get_section_name(self) -> str:
         """
         Get the name of the section this extractor handles.
-        
+
         Returns:
             Section name string
         """
         pass
-    
+
+    def _section_name_absent(self, content: str, section_name: str) -> bool:
+        """
+        Cheap literal check on the raw content before any cleaning or regex
+        work: if the section name never occurs, the extractor can return
+        None outright. Uses the shared cached lowered copy.
+        """
+        return section_name.lower() not in _lowered(content)
+
     def _clean_content(self, content: str) -> str:
         """
         Clean content by removing navigation elements and normalizing.
-        
+
         Args:
             content: Raw content to clean
-            
+
         Returns:
             Cleaned content
         """
-        # Remove common navigation elements
-        navigation_patterns = [
-            r'Download PDF.*?Share',
-            r'Cite this review.*?Full text views:.*?\d+',
-            r'Contents\s*\n.*?Related\n',
-            r'Cochrane Clinical Answers.*?Request data reuse',
-            r'Browse Publications.*?Cookie Preferences',
-            r'Copyright ©.*?Cookie Preferences',
-            r'Skip to.*?Sign In',
-            r'Trusted evidence.*?Basic Search',
-            r'Unlock the full review.*?Cookie P'
-        ]
-        
-        cleaned = content
-        for pattern in navigation_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Normalize whitespace
-        cleaned = re.sub(r'\n+', '\n', cleaned)
-        cleaned = re.sub(r'[ \t]+', ' ', cleaned)
-        
-        return cleaned.strip()
-    
+        return _clean_content_cached(content)
+
     def _find_section_start(self, content: str, section_name: str) -> Optional[int]:
         """
         Find the start position of a section in content.
@@ -79,61 +530,67 @@ class BaseSectionExtractor(ABC):
         Returns:
             Start position if found, None otherwise
         """
-        # Enhanced patterns for better section detection
-        patterns = [
-            # Standard patterns
-            rf'^{re.escape(section_name)}\s*\n',
-            rf'{re.escape(section_name)}\s*\n(?:available in\s*\n)?',
-            rf'{re.escape(section_name)}\s*\n[A-Z]',
-            rf'{re.escape(section_name)}[:\s]*[A-Z]',
-            # Additional patterns for better coverage
-            rf'\n{re.escape(section_name)}\s*\n',
-            rf'\n{re.escape(section_name)}\s*\n(?:available in\s*\n)?',
-            rf'\n{re.escape(section_name)}\s*\n[A-Z]',
-            rf'\n{re.escape(section_name)}[:\s]*[A-Z]',
-            # Pattern for sections that might be followed by specific text
-            rf'{re.escape(section_name)}\s*\n(?:available in\s*\n)?(?:English|Español|Français)',
-            # Pattern for sections that might have extra whitespace
-            rf'{re.escape(section_name)}\s+\n',
-            rf'\n{re.escape(section_name)}\s+\n'
-        ]
+        # Cheap gate: the shared linear header scan says whether the name
+        # occurs at all before any of the regex batteries run
+        positions = _locate_section_headers(content).get(section_name.lower())
+        if not positions:
+            return None
+
+        # Every start pattern begins with the literal name or a newline just
+        # before it, so the verifying regexes can start at the first literal
+        # occurrence instead of re-scanning the whole prefix
+        search_from = positions[0] - 1 if positions[0] else 0
 
         # For Plain Language Summary, look for the one with "available in" - this is the actual content section
         if section_name.lower() == 'plain language summary':
             # Look for the actual PLS section that has "available in" followed by language codes
-            content_pattern = rf'{re.escape(section_name)}\s*\n(?:available in\s*\n)?(?:English|Español|Français|简体中文|繁體中文|한국어|日本語|Bahasa Malaysia|Polski|Română|Русский|ภาษาไทย|فارسی)'
-            match = re.search(content_pattern, content, re.MULTILINE | re.IGNORECASE)
+            match = _PLS_CONTENT_RE.search(content, search_from)
             if match:
                 return match.start()
 
         # For Methods, Results, Background, and Objectives, look for the actual content sections, not navigation
-        if section_name.lower() in ['methods', 'results', 'background', 'objectives']:
+        content_patterns = _CONTENT_SECTION_PATTERNS.get(section_name)
+        if content_patterns is not None:
             # Look for the actual content sections that have subsections
-            content_patterns = [
-                # Methods content patterns
-                rf'{re.escape(section_name)}\s*\n(?:Criteria for considering studies|Types of studies|Search methods|Data collection)',
-                # Results content patterns  
-                rf'{re.escape(section_name)}\s*\n(?:Description of studies|Results of the search|Included studies|Excluded studies)',
-                # Background content patterns - distinguish from Abstract subsections
-                rf'{re.escape(section_name)}\s*\n(?:Description of the condition|The extrauterine|Why it is important)',
-                # Objectives content patterns - the standalone section comes after Background
-                rf'{re.escape(section_name)}\s*\n(?:To determine|To assess|To evaluate|To compare|To review|To investigate).*?\n(?=Methods)',
-                # General pattern for content sections
-                rf'{re.escape(section_name)}\s*\n[A-Z][a-z].*?(?:\n[A-Z][a-z]|\n[A-Z][a-z][a-z])'
-            ]
-            
             for pattern in content_patterns:
-                match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
+                match = pattern.search(content, search_from)
                 if match:
                     return match.start()
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
+        for pattern in _START_PATTERNS.get(section_name) or _start_patterns(section_name):
+            match = pattern.search(content, search_from)
             if match:
                 return match.start()
 
         return None
-    
+
+    def _resolve_section_span(self, content: str, section_name: str,
+                              index: Optional[Dict[str, Tuple[int, int]]] = None
+                              ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Resolve a section's start position and text, via the shared index
+        when one is provided.
+
+        Args:
+            content: Cleaned content
+            section_name: Display name of the section
+            index: Optional shared section index built once per document
+
+        Returns:
+            (start_pos, section_text), or (None, None) if not found
+        """
+        if index is not None:
+            span = index.get(section_name.lower())
+            if span is None:
+                return None, None
+            start_pos, end_pos = span
+            return start_pos, _trimmed_slice(content, start_pos, end_pos)
+
+        start_pos = self._find_section_start(content, section_name)
+        if start_pos is None:
+            return None, None
+        return start_pos, self._extract_until_next_section(content, start_pos, section_name)
+
     def _extract_until_next_section(self, content: str, start_pos: int, section_name: str) -> str:
         """
         Extract content until the next major section.
@@ -146,276 +603,201 @@ class BaseSectionExtractor(ABC):
         Returns:
             Extracted section content
         """
-        # Define all possible next sections in order of appearance
-        all_sections = [
-            'Abstract', 'PICOs', 'Plain language summary', 'Authors\' conclusions',
-            'Summary of findings', 'Background', 'Objectives', 'Methods', 'Results', 'Discussion'
-        ]
-        
-        # Remove current section from the list
-        next_sections = [s for s in all_sections if s.lower() != section_name.lower()]
-        
+        end_pos = self._find_section_end(content, start_pos, section_name)
+        return _trimmed_slice(content, start_pos, end_pos)
+
+    def _find_section_end(self, content: str, start_pos: int, section_name: str) -> int:
+        """
+        Find the end position of the section starting at start_pos.
+
+        Args:
+            content: Full content
+            start_pos: Start position of current section
+            section_name: Name of current section
+
+        Returns:
+            End position of the section
+        """
+        section_key = section_name.lower()
         end_pos = len(content)
-        
-        # For Abstract section, we need to be more careful about boundaries
-        if section_name.lower() == 'abstract':
-            # Look for the next major section that's not Abstract
-            for next_section in next_sections:
-                patterns = [
-                    rf'\n{re.escape(next_section)}\s*\n',
-                    rf'\n{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                    rf'\n{re.escape(next_section)}\s*\n[A-Z]',
-                    rf'\n{re.escape(next_section)}[:\s]*[A-Z]'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if match:
-                        potential_end = start_pos + match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        # Special handling for Plain Language Summary - has subsections that might be confused with next sections
-        elif section_name.lower() == 'plain language summary':
-            # Look for the actual major sections that come after PLS (not PLS subsections)
-            # Major sections have specific patterns that distinguish them from PLS subsections
-            patterns = [
-                # Summary of findings - look for table content
-                rf'\nSummary of findings\s*\n(?:Open in|Summary of findings\s+\d+)',
-                # Authors' conclusions - look for it appearing as a major section with specific content
-                rf'\nAuthors\' conclusions\s*\n(?:Implications for|At present)',
-                # Background - look for it with specific subsections that don't exist in PLS
-                rf'\nBackground\s*\n(?:Description of the condition|The extrauterine|Why it is important)',
-                # Objectives - look for it followed by Methods
-                rf'\nObjectives\s*\n(?:To determine).*?\n(?=Methods)',
-                # Methods - look for standard Methods subsections
-                rf'\nMethods\s*\n(?:Criteria for considering|Types of studies|Search methods)',
-                # Results - look for standard Results subsections  
-                rf'\nResults\s*\n(?:Description of studies|Results of the search|Included studies)',
-                # Discussion - look for it as the last major section
-                rf'\nDiscussion\s*\n[A-Z][a-z].*\n(?:Summary of main results|Overall completeness|Quality of the evidence|Potential biases)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE | re.DOTALL)
-                if match:
-                    potential_end = start_pos + match.start()
-                    if potential_end < end_pos:
-                        end_pos = potential_end
-                    break
-        
-        # Special handling for Methods section - often has subsections that might be confused with next sections
-        elif section_name.lower() == 'methods':
-            # Look for specific Methods subsections that might be confused with next major sections
-            methods_subsections = [
-                'criteria for considering studies for this review',
-                'search methods for identification of studies',
-                'data collection and analysis',
-                'selection of studies',
-                'data extraction and management',
-                'assessment of risk of bias in included studies',
-                'measures of treatment effect',
-                'unit of analysis issues',
-                'dealing with missing data',
-                'assessment of heterogeneity',
-                'assessment of reporting biases',
-                'data synthesis',
-                'subgroup analysis and investigation of heterogeneity',
-                'sensitivity analysis'
-            ]
-            
-            # Only look for major sections that are NOT Methods subsections
-            major_sections_only = ['Results', 'Discussion', 'Authors\' conclusions', 'Summary of findings']
-            for next_section in major_sections_only:
-                patterns = [
-                    rf'\n{re.escape(next_section)}\s*\n',
-                    rf'\n{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                    rf'\n{re.escape(next_section)}\s*\n[A-Z]',
-                    rf'\n{re.escape(next_section)}[:\s]*[A-Z]'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if match:
-                        potential_end = start_pos + match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        # Special handling for Results section - often has subsections that might be confused with next sections
-        elif section_name.lower() == 'results':
-            # Look for specific Results subsections that might be confused with next major sections
-            results_subsections = [
-                'description of studies',
-                'results of the search',
-                'included studies',
-                'excluded studies',
-                'risk of bias in included studies',
-                'methodology characteristics',
-                'patient characteristics',
-                'interventions',
-                'outcomes'
-            ]
-            
-            # Only look for major sections that are NOT Results subsections
-            major_sections_only = ['Discussion', 'Authors\' conclusions', 'Summary of findings']
-            for next_section in major_sections_only:
-                patterns = [
-                    rf'\n{re.escape(next_section)}\s*\n',
-                    rf'\n{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                    rf'\n{re.escape(next_section)}\s*\n[A-Z]',
-                    rf'\n{re.escape(next_section)}[:\s]*[A-Z]'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if match:
-                        potential_end = start_pos + match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        # Special handling for Objectives section - it comes before Methods and should stop at Methods section start
-        elif section_name.lower() == 'objectives':
-            # Look for the Methods section start, or Background if Objectives is mispositioned
-            for next_section in ['Background', 'Methods', 'Results', 'Discussion']:
-                patterns = [
-                    rf'\n{re.escape(next_section)}\s*\n',
-                    rf'\n{re.escape(next_section)}\s*\n[A-Z]',
-                    rf'\n{re.escape(next_section)}[:\s]*[A-Z]'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if match:
-                        potential_end = start_pos + match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        # Special handling for Discussion section - it's often the last major section
-        elif section_name.lower() == 'discussion':
-            # Look for common end markers that indicate the end of the Discussion
-            end_markers = [
-                r'Figures and tables',
-                r'References',
-                r'Supplementary materials',
-                r'Search strategies',
-                r'Characteristics of studies',
-                r'Analyses',
-                r'Download data',
-                r'Related',
-                r'Cochrane Clinical Answers',
-                r'Editorials',
-                r'Audio summaries',
-                r'Special Collections',
-                r'About this review',
-                r'Information',
-                r'Authors',
-                r'Version history',
-                r'Keywords',
-                r'Related content',
-                r'Translation notes',
-                r'Request permissions',
-                r'Request data reuse'
-            ]
-            
-            for marker in end_markers:
-                pattern = rf'{re.escape(marker)}'
-                match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                if match:
-                    potential_end = start_pos + match.start()
-                    if potential_end < end_pos:
-                        end_pos = potential_end
+
+        # Discussion ends at trailing navigation markers: plain literals,
+        # scanned case-sensitively against the shared lowered copy
+        if section_key == 'discussion':
+            lowered = _lowered(content)
+            for literal in _DISCUSSION_END_LITERALS:
+                pos = lowered.find(literal, start_pos)
+                if pos != -1:
+                    if pos < end_pos:
+                        end_pos = pos
                     break
-            
+
             # If no end markers found, Discussion might be the last section
             # Check if we're near the end of the content
-            if end_pos > len(content) * 0.9:  # If we're in the last 10% of content
+            if end_pos > len(content) * 0.9:
                 end_pos = len(content)  # Take everything to the end
-        
+
+            return end_pos
+
+        # Sections with bespoke end patterns are dispatched through the
+        # module-level table instead of an if/elif ladder
+        special_patterns = _SPECIAL_END_RES.get(section_key)
+        if special_patterns is not None:
+            for pattern in special_patterns:
+                # pos= keeps positions absolute and avoids copying the tail
+                match = pattern.search(content, start_pos)
+                if match:
+                    if match.start() < end_pos:
+                        end_pos = match.start()
+                    break
+
+        elif section_key in _SECTION_END_RES:
+            # Methods/Results: one search of the restricted major-header
+            # alternation finds the earliest true boundary directly. The
+            # literal presence check first skips the search entirely when
+            # none of the boundary names occur after start_pos.
+            if _any_section_after(content, _SECTION_END_NAMES[section_key], start_pos):
+                match = _SECTION_END_RES[section_key].search(content, start_pos)
+                if match:
+                    end_pos = match.start()
+
         else:
-            # For other sections, use improved logic with better pattern matching
-            for next_section in next_sections:
-                patterns = [
-                    rf'^{re.escape(next_section)}\s*\n',
-                    rf'{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                    rf'{re.escape(next_section)}\s*\n[A-Z]',
-                    rf'{re.escape(next_section)}[:\s]*[A-Z]',
-                    rf'\n{re.escape(next_section)}\s*\n',
-                    rf'\n{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                    # Additional patterns for better coverage
-                    rf'\n\s*{re.escape(next_section)}\s*\n',
-                    rf'\n\s*{re.escape(next_section)}\s*$',
-                    rf'^{re.escape(next_section)}\s*$'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if match:
-                        potential_end = start_pos + match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        return content[start_pos:end_pos].strip()
-    
-    def _extract_subsection_content(self, section_text: str, subsection_name: str, 
+            # Everything else (Abstract, Objectives, ...): one finditer pass
+            # over the tail for the earliest allowed header. The special
+            # cases restrict which section names count as a boundary so
+            # subsection headers are not mistaken for one.
+            allowed = _NEXT_SECTION_ALLOWED.get(section_key)
+            if allowed is None:
+                allowed = _GENERIC_NEXT_ALLOWED.get(section_key)
+            if allowed is None:
+                # Stray section name: exclude just itself
+                allowed = frozenset(s.lower() for s in _ALL_SECTIONS) - {section_key}
+            if _any_section_after(content, allowed, start_pos):
+                boundary = _find_next_section_boundary(content, start_pos, allowed)
+                if boundary is not None:
+                    end_pos = boundary
+
+        return end_pos
+
+    def _extract_subsection_content(self, section_text: str, subsection_name: str,
                                   next_subsection_names: list = None) -> Optional[str]:
         """
         Extract content for a specific subsection.
-        
+
         Args:
             section_text: Text of the parent section
             subsection_name: Name of the subsection to extract
             next_subsection_names: List of possible next subsection names
-            
+
         Returns:
             Subsection content if found, None otherwise
         """
         # Convert underscore-separated names to space-separated names for matching
         # e.g., 'search_methods' -> 'search methods'
         normalized_name = subsection_name.replace('_', ' ')
-        
-        # Create pattern for the subsection
-        patterns = [
-            rf'^{re.escape(normalized_name)}\s*\n',
-            rf'{re.escape(normalized_name)}\s*\n(?:available in\s*\n)?',
-            rf'{re.escape(normalized_name)}\s*\n[A-Z]',
-            rf'{re.escape(normalized_name)}[:\s]*[A-Z]'
-        ]
-        
+
         match = None
-        for pattern in patterns:
-            match = re.search(pattern, section_text, re.MULTILINE | re.IGNORECASE)
+        for pattern in _subsection_start_patterns(normalized_name):
+            match = pattern.search(section_text)
             if match:
                 break
-        
+
         if not match:
             return None
-        
+
         start_pos = match.end()
-        
+
         # Find end position
         end_pos = len(section_text)
-        
+
         if next_subsection_names:
-            for next_subsection in next_subsection_names:
-                # Normalize next subsection name too
-                normalized_next = next_subsection.replace('_', ' ')
-                next_patterns = [
-                    rf'^{re.escape(normalized_next)}\s*\n',
-                    rf'{re.escape(normalized_next)}\s*\n[A-Z]',
-                    rf'{re.escape(normalized_next)}[:\s]*[A-Z]'
-                ]
-                
-                for next_pattern in next_patterns:
-                    next_match = re.search(next_pattern, section_text[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if next_match:
-                        potential_end = start_pos + next_match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        return section_text[start_pos:end_pos].strip()
+            # One shared combined regex finds the earliest following
+            # subsection header in a single pass over the tail
+            next_pattern = _subsection_next_combined(tuple(next_subsection_names))
+            next_match = next_pattern.search(section_text[start_pos:])
+            if next_match:
+                potential_end = start_pos + next_match.start()
+                if potential_end < end_pos:
+                    end_pos = potential_end
+
+        return _trimmed_slice(section_text, start_pos, end_pos)
+
+    def _extract_all_subsections(self, section_text: str,
+                                 ordered_names: list) -> Dict[str, str]:
+        """
+        Extract every subsection of a parent section in one finditer pass.
+
+        One scan of the union pattern replaces the per-subsection loop of
+        start searches and tail boundary searches: each header hit serves
+        both as its own subsection's start and as the end boundary of the
+        preceding one.
+
+        Args:
+            section_text: Text of the parent section
+            ordered_names: Subsection names in their expected order
+
+        Returns:
+            Dictionary of subsection names to content
+        """
+        # A subsection span must exceed 10 chars to be kept, so text this
+        # short cannot yield anything — skip all pattern work
+        if len(section_text) < 12:
+            return {}
+
+        normalized = tuple(name.replace('_', ' ').lower() for name in ordered_names)
+        order = {name: i for i, name in enumerate(normalized)}
+        pattern = _subsection_union_pattern(normalized)
+
+        # Everything below stays interpreter-bound, so the loop binds its
+        # lookups to locals once; a C extension was considered and rejected
+        # since the regex engine (already C) dominates this path
+        # DFA prefilter: bail out (or skip the prefix) before any regex work
+        # when the literal names say there is nothing to find
+        scan_from = 0
+        automaton = _subsection_automaton(normalized)
+        if automaton is not None:
+            first_hit = next(automaton.iter(section_text.lower()), None)
+            if first_hit is None:
+                return {}
+            hit_end, length = first_hit
+            scan_from = max(0, hit_end - length)
+
+        order_get = order.get
+        first_hits: Dict[int, int] = {}
+        boundary_hits = []
+        boundary_append = boundary_hits.append
+        for match in pattern.finditer(section_text, scan_from):
+            variant = match.lastgroup
+            idx = order_get(match.group(variant).lower())
+            if idx is None:
+                continue
+            if idx not in first_hits:
+                # Content starts after the header line; the capital-followed
+                # variants keep the capital itself in the content
+                if variant in ('h1', 'h2'):
+                    content_start = match.end()
+                elif variant == 'h3':
+                    content_start = match.end() - 1
+                else:
+                    content_start = match.end() - 1 if '\n' in match.group(0) else match.end()
+                first_hits[idx] = content_start
+            if variant != 'h2':
+                boundary_append((match.start(), idx))
+
+        subsections = {}
+        for idx, content_start in sorted(first_hits.items()):
+            end_pos = len(section_text)
+            for pos, boundary_idx in boundary_hits:
+                if boundary_idx > idx and pos >= content_start:
+                    end_pos = pos
+                    break
+            # Trim by index so rejected subsections never allocate a string
+            lo, hi = content_start, end_pos
+            while lo < hi and section_text[lo].isspace():
+                lo += 1
+            while hi > lo and section_text[hi - 1].isspace():
+                hi -= 1
+            if hi - lo > 10:
+                subsections[ordered_names[idx]] = section_text[lo:hi]
+
+        return subsections
@@ -3,10 +3,36 @@ Refactored section extractor using individual section extractors.
 Provides comprehensive extraction of all Cochrane sections and subsections.
 """
 
+import logging
 import re
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
 from src.core.data_models import CleanedContent, ExtractedSections, SectionContent
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+from .base_section_extractor import _ALL_SECTIONS, _compile_scrubbers, warmup
+
+# Navigation scrubbers for raw full_content, compiled once (re2 when available)
+_FULL_CONTENT_NAV_RES = _compile_scrubbers((
+    r'Download PDF.*?Share',
+    r'Cite this review.*?Full text views:.*?\d+',
+    r'Contents\s*\n.*?Related\n',
+    r'Cochrane Clinical Answers.*?Request data reuse',
+    r'Browse Publications.*?Cookie Preferences',
+    r'Copyright ©.*?Cookie Preferences',
+    r'Unlock the full review.*?Cookie P',
+    r'Skip to Content.*?Sign In',
+    r'Trusted evidence.*?Basic Search',
+    r'Cookie Preferences.*?Cookie Preferences',
+    r'Request data reuse.*?Request data reuse'
+))
+
+# Pre-bound sub methods for the scrub loop (one C call per pattern)
+_FULL_CONTENT_NAV_SUBS = tuple(p.sub for p in _FULL_CONTENT_NAV_RES)
+
 # Import all section extractors
 from .sections import (
     AbstractExtractor,
@@ -22,11 +48,72 @@ from .sections import (
 )
 
 
+@lru_cache(maxsize=256)
+def _extract_actual_content_cached(full_content: str) -> str:
+    """
+    Cached implementation of _extract_actual_content_from_full.
+
+    The cleaner is pure, so repeated or re-processed documents skip the
+    DOTALL substitutions over the raw content entirely.
+    """
+    # Enhanced content extraction logic
+    content_start_patterns = [
+        r'Cochrane Database of Systematic reviews.*?Review - Intervention',
+        r'Review - Intervention.*?Abstract',
+        r'Authors\' declarations of interest.*?Abstract',
+        r'Abstract\s*\n(?:available in\s*\n)?',
+        r'Background\s*\n(?:available in\s*\n)?',
+        r'PICOs\s*\n',
+        r'Plain language summary\s*\n(?:available in\s*\n)?',
+        r'Authors\' conclusions\s*\n(?:available in\s*\n)?'
+    ]
+
+    content_start = 0
+    for pattern in content_start_patterns:
+        match = re.search(pattern, full_content, re.DOTALL | re.IGNORECASE)
+        if match:
+            content_start = match.start()
+            break
+
+    if content_start == 0:
+        # Fallback: look for the first section header, tracking the byte
+        # offset as we go instead of re-summing all preceding lines
+        section_headers = ['Abstract', 'Background', 'Objectives', 'Methods', 'Results', 'Discussion', 'PICOs', 'Plain language summary', 'Authors\' conclusions', 'Summary of findings']
+
+        pos = 0
+        for line in full_content.split('\n'):
+            line_stripped = line.strip()
+            # Look for section headers first
+            if line_stripped in section_headers:
+                content_start = pos
+                break
+            # If no section headers found, look for substantial text
+            elif len(line_stripped) > 50 and not line_stripped.startswith(('Skip to', 'Trusted evidence', 'Basic Search', 'Sign In')):
+                content_start = pos
+                break
+            pos += len(line) + 1
+
+    # Extract content from the start position
+    content = full_content[content_start:]
+
+    # Remove navigation elements
+    for sub in _FULL_CONTENT_NAV_SUBS:
+        content = sub('', content)
+
+    # Clean up extra whitespace
+    content = re.sub(r'\n+', '\n', content)
+    content = re.sub(r'[ \t]+', ' ', content)
+
+    return content.strip()
+
+
 class RefactoredSectionExtractor:
     """Refactored section extractor using individual section extractors."""
-    
+
     def __init__(self):
         """Initialize all section extractors."""
+        # Force lazy pattern setup now rather than on the first document
+        warmup()
         self.extractors = [
             AbstractExtractor(),
             PicosExtractor(),
@@ -39,128 +126,134 @@ class RefactoredSectionExtractor:
             ResultsExtractor(),
             DiscussionExtractor()
         ]
-    
+
     def extract_sections(self, content_input) -> ExtractedSections:
         """
         Extract all sections using specialized extractors.
-        
+
         Args:
             content_input: Either CleanedContent object or string content to extract sections from
-            
+
         Returns:
             ExtractedSections with complete hierarchical structure
         """
         sections = {}
         total_subsections = 0
-        
+
         # Handle both CleanedContent objects and string input
         if isinstance(content_input, str):
             content_to_extract = self._extract_actual_content_from_full(content_input)
         else:
             # Determine content to extract
             content_to_extract = content_input.abstract or content_input.full_content
-            
+
             # If we're using full_content, clean it first
             if not content_input.abstract and content_input.full_content:
                 content_to_extract = self._extract_actual_content_from_full(content_input.full_content)
-        
+
+        # Build the shared section index once so each extractor works on its
+        # own slice instead of re-scanning the whole document
+        section_index = self._build_section_index(content_to_extract)
+
         # Extract each section using specialized extractors
         for extractor in self.extractors:
             try:
-                section_content = extractor.extract(content_to_extract)
+                section_content = extractor.extract(content_to_extract, section_index)
                 if section_content:
                     sections[extractor.get_section_name()] = section_content
                     total_subsections += len(section_content.subsections)
             except Exception as e:
-                # Log error but continue with other extractors
-                print(f"Error extracting {extractor.get_section_name()}: {e}")
+                # Log error but continue with other extractors; %-style args
+                # defer formatting until a handler actually wants the record
+                logger.warning("Error extracting %s: %s", extractor.get_section_name(), e)
                 continue
-        
+
         return ExtractedSections(
             sections=sections,
             section_count=len(sections),
             subsection_count=total_subsections
         )
-    
+
+    def extract_sections_batch(self, docs: List[str],
+                               workers: Optional[int] = None) -> List[ExtractedSections]:
+        """
+        Extract sections from many documents in parallel.
+
+        Section extraction is pure-CPU regex work on independent documents,
+        so it is dispatched to a process pool; on fork-based platforms each
+        worker inherits the precompiled module-level patterns.
+
+        Args:
+            docs: List of content strings to extract sections from
+            workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            List of ExtractedSections, in input order
+        """
+        # Pool spawn/teardown costs more than it saves on tiny batches
+        if len(docs) < 2 or workers == 1:
+            return [self.extract_sections(doc) for doc in docs]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_sections, docs, chunksize=16))
+
+    def _build_section_index(self, content: str) -> Dict[str, tuple]:
+        """
+        Locate every major section's (start, end) span in a single pass.
+
+        The boundary logic runs once here instead of once per extractor;
+        extractors then just slice their span out of the cleaned content.
+        Abstract keeps its own boundary handling and is not indexed.
+
+        Args:
+            content: Content the extractors will receive
+
+        Returns:
+            Dictionary mapping lowercased section name to (start, end)
+        """
+        probe = self.extractors[0]
+        cleaned_content = probe._clean_content(content)
+
+        # Phase 1: locate every section start (each lookup is anchored by the
+        # shared Aho-Corasick scan, so this is one linear pass overall)
+        starts = {}
+        for section_name in _ALL_SECTIONS:
+            if section_name.lower() == 'abstract':
+                continue
+            start_pos = probe._find_section_start(cleaned_content, section_name)
+            if start_pos is not None:
+                starts[section_name] = start_pos
+
+        # Phase 2: resolve each end from its own boundary rules. Spans may
+        # overlap deliberately — e.g. a Methods span can run past where the
+        # standalone Objectives section starts — so ends are NOT clamped at
+        # the next verified start.
+        index = {}
+        for section_name, start_pos in starts.items():
+            end_pos = probe._find_section_end(cleaned_content, start_pos, section_name)
+            index[section_name.lower()] = (start_pos, end_pos)
+
+        return index
+
     def _extract_actual_content_from_full(self, full_content: str) -> str:
         """
         Extract actual content from full_content that may contain navigation elements.
-        
+
         Args:
             full_content: Raw full content from the JSON
-            
+
         Returns:
             Cleaned content ready for section extraction
         """
-        # Enhanced content extraction logic
-        content_start_patterns = [
-            r'Cochrane Database of Systematic reviews.*?Review - Intervention',
-            r'Review - Intervention.*?Abstract',
-            r'Authors\' declarations of interest.*?Abstract',
-            r'Abstract\s*\n(?:available in\s*\n)?',
-            r'Background\s*\n(?:available in\s*\n)?',
-            r'PICOs\s*\n',
-            r'Plain language summary\s*\n(?:available in\s*\n)?',
-            r'Authors\' conclusions\s*\n(?:available in\s*\n)?'
-        ]
-        
-        content_start = 0
-        for pattern in content_start_patterns:
-            match = re.search(pattern, full_content, re.DOTALL | re.IGNORECASE)
-            if match:
-                content_start = match.start()
-                break
-        
-        if content_start == 0:
-            # Fallback: look for the first section header
-            lines = full_content.split('\n')
-            section_headers = ['Abstract', 'Background', 'Objectives', 'Methods', 'Results', 'Discussion', 'PICOs', 'Plain language summary', 'Authors\' conclusions', 'Summary of findings']
-            
-            for i, line in enumerate(lines):
-                line_stripped = line.strip()
-                # Look for section headers first
-                if line_stripped in section_headers:
-                    content_start = sum(len(lines[j]) + 1 for j in range(i))
-                    break
-                # If no section headers found, look for substantial text
-                elif len(line_stripped) > 50 and not line_stripped.startswith(('Skip to', 'Trusted evidence', 'Basic Search', 'Sign In')):
-                    content_start = sum(len(lines[j]) + 1 for j in range(i))
-                    break
-        
-        # Extract content from the start position
-        content = full_content[content_start:]
-        
-        # Remove navigation elements
-        navigation_patterns = [
-            r'Download PDF.*?Share',
-            r'Cite this review.*?Full text views:.*?\d+',
-            r'Contents\s*\n.*?Related\n',
-            r'Cochrane Clinical Answers.*?Request data reuse',
-            r'Browse Publications.*?Cookie Preferences',
-            r'Copyright ©.*?Cookie Preferences',
-            r'Unlock the full review.*?Cookie P',
-            r'Skip to Content.*?Sign In',
-            r'Trusted evidence.*?Basic Search',
-            r'Cookie Preferences.*?Cookie Preferences',
-            r'Request data reuse.*?Request data reuse'
-        ]
-        
-        for pattern in navigation_patterns:
-            content = re.sub(pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Clean up extra whitespace
-        content = re.sub(r'\n+', '\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
-        
-        return content.strip()
-    
+        return _extract_actual_content_cached(full_content)
+
     def get_extraction_stats(self, sections: Dict[str, SectionContent]) -> Dict[str, int]:
         """
         Get extraction statistics for debugging and analysis.
-        
+
         Args:
             sections: Dictionary of extracted sections
-            
+
         Returns:
             Dictionary with extraction statistics
         """
@@ -170,10 +263,10 @@ class RefactoredSectionExtractor:
             'sections_with_subsections': sum(1 for section in sections.values() if section.subsections),
             'sections_extracted': list(sections.keys())
         }
-        
+
         # Add per-section stats
         for section_name, section in sections.items():
             stats[f'{section_name}_subsections'] = len(section.subsections)
             stats[f'{section_name}_content_length'] = len(section.content)
-        
+
         return stats
@@ -9,22 +9,58 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# One alternation over every section that can follow the Abstract: a single
+# linear scan finds the earliest boundary instead of 4 sections x 4 pattern
+# variants searched separately. All variants share the same match start, so
+# folding their tails into one group preserves the boundary position.
+_ABSTRACT_END_RE = re.compile(
+    r"\n(?:PICOs|Plain language summary|Authors' conclusions|Summary of findings)"
+    r'(?:\s*\n|[:\s]*[A-Z])',
+    re.IGNORECASE
+)
+
+# Start and header-strip patterns compiled once at import instead of per document
+_ABSTRACT_START_RE = re.compile(r'Abstract\s*\n(?:available in\s*\n)?', re.IGNORECASE)
+_ABSTRACT_START_LINE_RE = re.compile(r'^Abstract\s*\n', re.MULTILINE | re.IGNORECASE)
+_ABSTRACT_ANYWHERE_RE = re.compile(r'Abstract\s*\n', re.IGNORECASE)
+_ABSTRACT_HEADER_RE = re.compile(r'^Abstract\s*\n(?:available in\s*\n)?', re.MULTILINE | re.IGNORECASE)
+
+
+# Subsection order, hoisted to a module constant so the extraction
+# call rebuilds nothing per document
+_SUBSECTION_ORDER = (
+    'available_in',
+    'background',
+    'objectives',
+    'search_methods',
+    'selection_criteria',
+    'data_collection_and_analysis',
+    'main_results',
+    'authors_conclusions',
+)
+
+
 class AbstractExtractor(BaseSectionExtractor):
     """Extracts the Abstract section with all its subsections."""
     
     def get_section_name(self) -> str:
         return "abstract"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Abstract section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Unused; the Abstract boundary needs its own handling below
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Abstract"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
         
@@ -32,17 +68,17 @@ class AbstractExtractor(BaseSectionExtractor):
         start_pos = None
         
         # Pattern 1: Look for "Abstract" followed by "available in"
-        abstract_pattern1 = re.search(r'Abstract\s*\n(?:available in\s*\n)?', cleaned_content, re.IGNORECASE)
+        abstract_pattern1 = _ABSTRACT_START_RE.search(cleaned_content)
         if abstract_pattern1:
             start_pos = abstract_pattern1.start()
         else:
             # Pattern 2: Look for "Abstract" at start of line
-            abstract_pattern2 = re.search(r'^Abstract\s*\n', cleaned_content, re.MULTILINE | re.IGNORECASE)
+            abstract_pattern2 = _ABSTRACT_START_LINE_RE.search(cleaned_content)
             if abstract_pattern2:
                 start_pos = abstract_pattern2.start()
             else:
                 # Pattern 3: Look for "Abstract" anywhere
-                abstract_pattern3 = re.search(r'Abstract\s*\n', cleaned_content, re.IGNORECASE)
+                abstract_pattern3 = _ABSTRACT_ANYWHERE_RE.search(cleaned_content)
                 if abstract_pattern3:
                     start_pos = abstract_pattern3.start()
         
@@ -52,34 +88,18 @@ class AbstractExtractor(BaseSectionExtractor):
         # For Abstract, we need to find the end manually since it doesn't have clear boundaries
         # Look for the next major section after Abstract (not subsections within Abstract)
         # The Abstract section typically ends with PICOs or Plain language summary
-        next_sections = ['PICOs', 'Plain language summary', 'Authors\' conclusions', 'Summary of findings']
-        
         end_pos = len(cleaned_content)
-        for next_section in next_sections:
-            # Look for the next section header - try multiple patterns
-            patterns = [
-                rf'\n{re.escape(next_section)}\s*\n',
-                rf'\n{re.escape(next_section)}\s*\n(?:available in\s*\n)?',
-                rf'\n{re.escape(next_section)}\s*\n[A-Z]',
-                rf'\n{re.escape(next_section)}[:\s]*[A-Z]'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, cleaned_content[start_pos:], re.MULTILINE | re.IGNORECASE)
-                if match:
-                    potential_end = start_pos + match.start()
-                    if potential_end < end_pos:
-                        end_pos = potential_end
-                    break
+        # pos= keeps positions absolute and avoids copying the tail
+        boundary = _ABSTRACT_END_RE.search(cleaned_content, start_pos)
+        if boundary:
+            end_pos = boundary.start()
         
         # Extract the full Abstract section
         section_text = cleaned_content[start_pos:end_pos].strip()
         
         # Remove the "Abstract" header from the content
-        section_content = section_text
-        abstract_header_pattern = r'^Abstract\s*\n(?:available in\s*\n)?'
-        section_content = re.sub(abstract_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _ABSTRACT_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         if len(section_content) < 50:
             return None
@@ -103,26 +123,5 @@ class AbstractExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
-        subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = [
-            'available_in',
-            'background', 
-            'objectives',
-            'search_methods',
-            'selection_criteria',
-            'data_collection_and_analysis',
-            'main_results',
-            'authors_conclusions'
-        ]
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_subsection_content(section_text, subsection_name, next_subsections)
-            if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
-        return subsections
+        # One finditer pass locates every subsection boundary at once
+        return self._extract_all_subsections(section_text, _SUBSECTION_ORDER)
@@ -9,38 +9,51 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Header-strip pattern compiled once at import instead of per document
+_CONCLUSIONS_HEADER_RE = re.compile(r"^Authors' conclusions\s*\n(?:available in\s*\n)?", re.MULTILINE | re.IGNORECASE)
+
+
+# Subsection order, hoisted to a module constant so the extraction
+# call rebuilds nothing per document
+_SUBSECTION_ORDER = (
+    'available_in',
+    'implications_for_practice',
+    'implications_for_research',
+)
+
+
 class AuthorsConclusionsExtractor(BaseSectionExtractor):
     """Extracts the Authors' Conclusions section with all its subsections."""
     
     def get_section_name(self) -> str:
         return "authors_conclusions"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Authors' Conclusions section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Authors' conclusions"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Authors' Conclusions section start
-        start_pos = self._find_section_start(cleaned_content, "Authors' conclusions")
+
+        # Locate the full Authors' Conclusions section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Authors' conclusions", index)
         if start_pos is None:
             return None
         
-        # Extract the full Authors' Conclusions section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Authors' conclusions")
-        
         # Remove the "Authors' conclusions" header from the content
-        section_content = section_text
-        conclusions_header_pattern = r'^Authors\' conclusions\s*\n(?:available in\s*\n)?'
-        section_content = re.sub(conclusions_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _CONCLUSIONS_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         if len(section_content) < 50:
             return None
@@ -64,21 +77,5 @@ class AuthorsConclusionsExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
-        subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = [
-            'available_in',
-            'implications_for_practice',
-            'implications_for_research'
-        ]
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_subsection_content(section_text, subsection_name, next_subsections)
-            if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
-        return subsections
+        # One finditer pass locates every subsection boundary at once
+        return self._extract_all_subsections(section_text, _SUBSECTION_ORDER)
@@ -9,38 +9,53 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Header-strip pattern compiled once at import instead of per document
+_BACKGROUND_HEADER_RE = re.compile(r'^Background\s*\n(?:available in\s*\n)?', re.MULTILINE | re.IGNORECASE)
+
+
+# Subsection order, hoisted to a module constant so the extraction
+# call rebuilds nothing per document
+_SUBSECTION_ORDER = (
+    'available_in',
+    'description_of_the_condition',
+    'description_of_the_intervention',
+    'how_the_intervention_might_work',
+    'why_it_is_important_to_do_this_review',
+)
+
+
 class BackgroundExtractor(BaseSectionExtractor):
     """Extracts the Background section with all its subsections."""
     
     def get_section_name(self) -> str:
         return "background"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Background section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Background"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Background section start
-        start_pos = self._find_section_start(cleaned_content, "Background")
+
+        # Locate the full Background section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Background", index)
         if start_pos is None:
             return None
         
-        # Extract the full Background section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Background")
-        
         # Remove the "Background" header from the content
-        section_content = section_text
-        background_header_pattern = r'^Background\s*\n(?:available in\s*\n)?'
-        section_content = re.sub(background_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _BACKGROUND_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         if len(section_content) < 50:
             return None
@@ -64,23 +79,5 @@ class BackgroundExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
-        subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = [
-            'available_in',
-            'description_of_the_condition',
-            'description_of_the_intervention',
-            'how_the_intervention_might_work',
-            'why_it_is_important_to_do_this_review'
-        ]
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_subsection_content(section_text, subsection_name, next_subsections)
-            if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
-        return subsections
+        # One finditer pass locates every subsection boundary at once
+        return self._extract_all_subsections(section_text, _SUBSECTION_ORDER)
@@ -9,38 +9,65 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Header-strip pattern compiled once at import instead of per document
+_METHODS_HEADER_RE = re.compile(r'^Methods\s*\n(?:available in\s*\n)?', re.MULTILINE | re.IGNORECASE)
+
+
+# Subsection order, hoisted to a module constant so the extraction
+# call rebuilds nothing per document
+_SUBSECTION_ORDER = (
+    'available_in',
+    'criteria_for_considering_studies_for_this_review',
+    'search_methods_for_identification_of_studies',
+    'data_collection_and_analysis',
+    'selection_of_studies',
+    'data_extraction_and_management',
+    'assessment_of_risk_of_bias_in_included_studies',
+    'measures_of_treatment_effect',
+    'unit_of_analysis_issues',
+    'dealing_with_missing_data',
+    'assessment_of_heterogeneity',
+    'assessment_of_reporting_biases',
+    'data_synthesis',
+    'subgroup_analysis_and_investigation_of_heterogeneity',
+    'sensitivity_analysis',
+    'trial_sequential_analysis',
+    'summary_of_findings_tables',
+)
+
+
 class MethodsExtractor(BaseSectionExtractor):
     """Extracts the Methods section with all its subsections."""
     
     def get_section_name(self) -> str:
         return "methods"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Methods section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Methods"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Methods section start
-        start_pos = self._find_section_start(cleaned_content, "Methods")
+
+        # Locate the full Methods section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Methods", index)
         if start_pos is None:
             return None
         
-        # Extract the full Methods section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Methods")
-        
         # Remove the "Methods" header from the content
-        section_content = section_text
-        methods_header_pattern = r'^Methods\s*\n(?:available in\s*\n)?'
-        section_content = re.sub(methods_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _METHODS_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         if len(section_content) < 50:
             return None
@@ -64,35 +91,5 @@ class MethodsExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
-        subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = [
-            'available_in',
-            'criteria_for_considering_studies_for_this_review',
-            'search_methods_for_identification_of_studies',
-            'data_collection_and_analysis',
-            'selection_of_studies',
-            'data_extraction_and_management',
-            'assessment_of_risk_of_bias_in_included_studies',
-            'measures_of_treatment_effect',
-            'unit_of_analysis_issues',
-            'dealing_with_missing_data',
-            'assessment_of_heterogeneity',
-            'assessment_of_reporting_biases',
-            'data_synthesis',
-            'subgroup_analysis_and_investigation_of_heterogeneity',
-            'sensitivity_analysis',
-            'trial_sequential_analysis',
-            'summary_of_findings_tables'
-        ]
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_subsection_content(section_text, subsection_name, next_subsections)
-            if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
-        return subsections
+        # One finditer pass locates every subsection boundary at once
+        return self._extract_all_subsections(section_text, _SUBSECTION_ORDER)
@@ -9,46 +9,78 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Header-strip pattern compiled once at import
+_OBJECTIVES_HEADER_RE = re.compile(r'^Objectives\s*\n', re.MULTILINE | re.IGNORECASE)
+
+# Section headers that can follow an over-long Objectives extraction
+_NEXT_HEADERS = ('Summary', 'Background', 'Methods', 'Results', 'Discussion', 'Authors')
+
+
+def _find_sentence_end(text: str) -> int:
+    """
+    Find where the Objectives sentence ends: a period, optional spaces, a
+    newline, then a capitalized word or known section header.
+
+    A str.find loop over the period positions replaces the old lookahead
+    regex — the same boundary, found with C-level substring scanning.
+
+    Returns the index of the terminating newline, or -1 if none is found.
+    """
+    n = len(text)
+    i = text.find('.')
+    while i != -1:
+        j = i + 1
+        while j < n and text[j] in ' \t':
+            j += 1
+        if j < n and text[j] == '\n':
+            follow = text[j + 1:j + 3]
+            if follow[:1].isupper() and (follow[1:2].islower()
+                                         or text.startswith(_NEXT_HEADERS, j + 1)):
+                return j
+        i = text.find('.', i + 1)
+    return -1
+
+
 class ObjectivesExtractor(BaseSectionExtractor):
     """Extracts the Objectives section (standalone section)."""
     
     def get_section_name(self) -> str:
         return "objectives"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Objectives section.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Objectives"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Objectives section start
-        start_pos = self._find_section_start(cleaned_content, "Objectives")
+
+        # Locate the full Objectives section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Objectives", index)
         if start_pos is None:
             return None
         
-        # Extract the full Objectives section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Objectives")
-        
         # Remove the "Objectives" header from the content
-        section_content = section_text
-        objectives_header_pattern = r'^Objectives\s*\n'
-        section_content = re.sub(objectives_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _OBJECTIVES_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         # Objectives should only be a single sentence or a few sentences
         # If we extracted too much (e.g., > 500 chars), look for sentence boundary
         if len(section_content) > 500:
             # Try to find where the Objectives sentence ends (period followed by newline and capital letter or section header)
-            sentence_end = re.search(r'\.\s*\n(?=[A-Z][a-z]|Summary|Background|Methods|Results|Discussion|Authors)', section_content)
-            if sentence_end:
-                section_content = section_content[:sentence_end.end() - 1].strip()
+            sentence_end = _find_sentence_end(section_content)
+            if sentence_end != -1:
+                section_content = section_content[:sentence_end].strip()
         
         if len(section_content) < 50:
             return None
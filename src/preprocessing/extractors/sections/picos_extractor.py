@@ -8,6 +8,34 @@ from typing import Optional, Dict
 from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Header-strip pattern compiled once at import instead of per document
+_PICOS_HEADER_RE = re.compile(r'^PICOs\s*\n', re.MULTILINE | re.IGNORECASE)
+
+# PICOs has exactly four fixed subsections, so one union pattern locates
+# every header (with its optional parenthesised qualifier) in a single pass
+_PICOS_SUBSECTION_ORDER = ('population', 'intervention', 'comparison', 'outcome')
+
+
+def _compile_picos_union():
+    """Compile the subsection union, through re2's linear-time DFA when available."""
+    raw = r'^(?P<name>population|intervention|comparison|outcome)(?:\s*\([^)]*\))?\s*\n'
+    if re2 is not None:
+        try:
+            # re2 takes flags inline rather than as compile() arguments
+            return re2.compile('(?im)' + raw)
+        except re2.error:
+            pass
+    return re.compile(raw, re.MULTILINE | re.IGNORECASE)
+
+
+_PICOS_SUBSECTION_RE = _compile_picos_union()
+
 
 class PicosExtractor(BaseSectionExtractor):
     """Extracts the PICOs section with all its subsections."""
@@ -15,32 +43,32 @@ class PicosExtractor(BaseSectionExtractor):
     def get_section_name(self) -> str:
         return "picos"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract PICOs section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "PICOs"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find PICOs section start
-        start_pos = self._find_section_start(cleaned_content, "PICOs")
+
+        # Locate the full PICOs section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "PICOs", index)
         if start_pos is None:
             return None
         
-        # Extract the full PICOs section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "PICOs")
-        
         # Remove the "PICOs" header from the content
-        section_content = section_text
-        picos_header_pattern = r'^PICOs\s*\n'
-        section_content = re.sub(picos_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        header_match = _PICOS_HEADER_RE.match(section_text)
+        section_content = (section_text[header_match.end():] if header_match else section_text).strip()
         
         if len(section_content) < 50:
             return None
@@ -64,71 +92,30 @@ class PicosExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
+        order = {name: i for i, name in enumerate(_PICOS_SUBSECTION_ORDER)}
+
+        # One pass collects every subsection header hit in document order
+        hits = [
+            (match.start(), match.end(), order[match.group('name').lower()])
+            for match in _PICOS_SUBSECTION_RE.finditer(section_text)
+        ]
+
         subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = ['population', 'intervention', 'comparison', 'outcome']
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_picos_subsection_content(section_text, subsection_name, next_subsections)
+        seen = set()
+        for i, (_, content_start, idx) in enumerate(hits):
+            if idx in seen:
+                continue
+            seen.add(idx)
+
+            # Content runs to the next later-ordered subsection header
+            end_pos = len(section_text)
+            for next_start, _, next_idx in hits[i + 1:]:
+                if next_idx > idx:
+                    end_pos = next_start
+                    break
+
+            content = section_text[content_start:end_pos].strip()
             if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
+                subsections[_PICOS_SUBSECTION_ORDER[idx]] = content
+
         return subsections
-    
-    def _extract_picos_subsection_content(self, section_text: str, subsection_name: str, 
-                                        next_subsection_names: list = None) -> Optional[str]:
-        """
-        Extract content for a specific PICOs subsection.
-        
-        Args:
-            section_text: Text of the PICOs section
-            subsection_name: Name of the subsection to extract
-            next_subsection_names: List of possible next subsection names
-            
-        Returns:
-            Subsection content if found, None otherwise
-        """
-        # Create pattern for the subsection (PICOs subsections often have parentheses)
-        patterns = [
-            rf'^{re.escape(subsection_name)}\s*\([^)]*\)\s*\n',
-            rf'^{re.escape(subsection_name)}\s*\n',
-            rf'{re.escape(subsection_name)}\s*\([^)]*\)\s*\n[A-Z]',
-            rf'{re.escape(subsection_name)}\s*\n[A-Z]'
-        ]
-        
-        match = None
-        for pattern in patterns:
-            match = re.search(pattern, section_text, re.MULTILINE | re.IGNORECASE)
-            if match:
-                break
-        
-        if not match:
-            return None
-        
-        start_pos = match.end()
-        
-        # Find end position
-        end_pos = len(section_text)
-        
-        if next_subsection_names:
-            for next_subsection in next_subsection_names:
-                next_patterns = [
-                    rf'^{re.escape(next_subsection)}\s*\([^)]*\)\s*\n',
-                    rf'^{re.escape(next_subsection)}\s*\n',
-                    rf'{re.escape(next_subsection)}\s*\([^)]*\)\s*\n[A-Z]',
-                    rf'{re.escape(next_subsection)}\s*\n[A-Z]'
-                ]
-                
-                for next_pattern in next_patterns:
-                    next_match = re.search(next_pattern, section_text[start_pos:], re.MULTILINE | re.IGNORECASE)
-                    if next_match:
-                        potential_end = start_pos + next_match.start()
-                        if potential_end < end_pos:
-                            end_pos = potential_end
-                        break
-        
-        return section_text[start_pos:end_pos].strip()
@@ -9,38 +9,61 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Subsection order, hoisted to a module constant so the extraction
+# call rebuilds nothing per document
+_SUBSECTION_ORDER = (
+    'description_of_studies',
+    'results_of_the_search',
+    'included_studies',
+    'excluded_studies',
+    'risk_of_bias_in_included_studies',
+    'methodology_characteristics',
+    'patient_characteristics',
+    'interventions',
+    'outcomes',
+    'leukoreduction_definition',
+    'type_of_filters',
+    'control_groups',
+    'cointervention',
+)
+
+
 class ResultsExtractor(BaseSectionExtractor):
     """Extracts the Results section with all its subsections."""
     
     def get_section_name(self) -> str:
         return "results"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Results section with subsections.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Results"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Results section start
-        start_pos = self._find_section_start(cleaned_content, "Results")
+
+        # Locate the full Results section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Results", index)
         if start_pos is None:
             return None
         
-        # Extract the full Results section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Results")
-        
-        # Remove the "Results" header from the content
-        section_content = section_text
-        results_header_pattern = r'^Results\s*\n'
-        section_content = re.sub(results_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        # Remove the "Results" header line with plain string ops — the
+        # header is fixed, so no regex machinery is needed
+        head, sep, rest = section_text.partition('\n')
+        if sep and head[:7].lower() == 'results' and not head[7:].strip():
+            section_content = rest.strip()
+        else:
+            section_content = section_text.strip()
         
         if len(section_content) < 50:
             return None
@@ -64,31 +87,5 @@ class ResultsExtractor(BaseSectionExtractor):
         Returns:
             Dictionary of subsection names to content
         """
-        subsections = {}
-        
-        # Define subsection order for proper extraction
-        subsection_order = [
-            'description_of_studies',
-            'results_of_the_search',
-            'included_studies',
-            'excluded_studies',
-            'risk_of_bias_in_included_studies',
-            'methodology_characteristics',
-            'patient_characteristics',
-            'interventions',
-            'outcomes',
-            'leukoreduction_definition',
-            'type_of_filters',
-            'control_groups',
-            'cointervention'
-        ]
-        
-        # Extract each subsection
-        for i, subsection_name in enumerate(subsection_order):
-            next_subsections = subsection_order[i+1:] if i < len(subsection_order) - 1 else []
-            
-            content = self._extract_subsection_content(section_text, subsection_name, next_subsections)
-            if content and len(content) > 10:
-                subsections[subsection_name] = content
-        
-        return subsections
+        # One finditer pass locates every subsection boundary at once
+        return self._extract_all_subsections(section_text, _SUBSECTION_ORDER)
@@ -9,38 +9,83 @@ from ..base_section_extractor import BaseSectionExtractor
 from src.core.data_models import SectionContent
 
 
+# Comparison headers paired with their end-boundary patterns. The old
+# DOTALL '.*?' + lookahead patterns forced the engine to probe every
+# position between header and boundary; locating the header and then the
+# boundary with two plain forward searches keeps matching linear on large
+# sections while producing the same spans
+_SOF_COMPARISON_SPECS = (
+    (re.compile(r'Summary of findings for the main comparison\.\s*', re.IGNORECASE),
+     re.compile(r'\n(?:Summary of findings \d+|Background)', re.IGNORECASE)),
+    (re.compile(r'Summary of findings \d+\.\s*', re.IGNORECASE),
+     re.compile(r'\n(?:Summary of findings \d+|Background)', re.IGNORECASE)),
+    (re.compile(r'Open in table viewer\s*', re.IGNORECASE),
+     re.compile(r'\n(?:Open in table viewer|Background)', re.IGNORECASE)),
+)
+
+_SOF_TABLE_HEADER_RES = tuple(
+    re.compile(p, re.IGNORECASE) for p in (
+        r'Patient or population:',
+        r'Setting:',
+        r'Intervention:',
+        r'Comparison:',
+        r'Outcomes\s*\n'
+    )
+)
+_SOF_TABLE_BOUNDARY_RE = re.compile(r'\nBackground', re.IGNORECASE)
+
+
+def _span_end(section_text: str, boundary_re, search_from: int) -> int:
+    """
+    Find where a SoF span ends: at the next boundary header, or at the
+    final newline when the text ends with one (the old patterns' '\\n$'
+    case). Returns -1 when neither exists, mirroring the old patterns
+    failing to match.
+    """
+    boundary = boundary_re.search(section_text, search_from)
+    if boundary is not None:
+        return boundary.start()
+    if section_text.endswith('\n'):
+        return len(section_text) - 1
+    return -1
+
+
 class SummaryOfFindingsExtractor(BaseSectionExtractor):
     """Extracts the Summary of Findings section with structured table data."""
     
     def get_section_name(self) -> str:
         return "summary_of_findings"
     
-    def extract(self, content: str) -> Optional[SectionContent]:
+    def extract(self, content: str, index=None) -> Optional[SectionContent]:
         """
         Extract Summary of Findings section.
-        
+
         Args:
             content: Full content to extract from
-            
+            index: Optional shared section index built once per document
+
         Returns:
             SectionContent if found, None otherwise
         """
+        # Skip cleaning and extraction when the raw content cannot contain the section
+        if self._section_name_absent(content, "Summary of findings"):
+            return None
+
         # Clean content first
         cleaned_content = self._clean_content(content)
-        
-        # Find Summary of Findings section start
-        start_pos = self._find_section_start(cleaned_content, "Summary of findings")
+
+        # Locate the full Summary of Findings section
+        start_pos, section_text = self._resolve_section_span(cleaned_content, "Summary of findings", index)
         if start_pos is None:
             return None
         
-        # Extract the full Summary of Findings section
-        section_text = self._extract_until_next_section(cleaned_content, start_pos, "Summary of findings")
-        
-        # Remove the "Summary of findings" header from the content
-        section_content = section_text
-        sof_header_pattern = r'^Summary of findings\s*\n'
-        section_content = re.sub(sof_header_pattern, '', section_content, flags=re.MULTILINE | re.IGNORECASE)
-        section_content = section_content.strip()
+        # Remove the "Summary of findings" header line with plain string
+        # ops — the header is fixed, so no regex machinery is needed
+        head, sep, rest = section_text.partition('\n')
+        if sep and head[:19].lower() == 'summary of findings' and not head[19:].strip():
+            section_content = rest.strip()
+        else:
+            section_content = section_text.strip()
         
         if len(section_content) < 50:
             return None
@@ -65,38 +110,44 @@ class SummaryOfFindingsExtractor(BaseSectionExtractor):
             Dictionary of subsection names to content
         """
         subsections = {}
-        
+
+        # Two cheap substring probes reject sections with no comparison
+        # headers before any of the comparison patterns run
+        lowered = section_text.lower()
+        has_comparisons = ('summary of findings' in lowered
+                           or 'open in table viewer' in lowered)
+
         # Extract individual comparison tables
-        comparison_patterns = [
-            r'Summary of findings for the main comparison\.\s*(.*?)(?=\n(?:Summary of findings \d+|Background|$))',
-            r'Summary of findings \d+\.\s*(.*?)(?=\n(?:Summary of findings \d+|Background|$))',
-            r'Open in table viewer\s*(.*?)(?=\n(?:Open in table viewer|Background|$))'
-        ]
-        
-        for i, pattern in enumerate(comparison_patterns):
-            matches = re.finditer(pattern, section_text, re.DOTALL | re.IGNORECASE)
-            for j, match in enumerate(matches):
-                subsection_name = f"comparison_{i+1}_{j+1}" if j > 0 else f"comparison_{i+1}"
-                content = match.group(1).strip()
-                if content and len(content) > 20:
-                    subsections[subsection_name] = content
-        
+        if has_comparisons:
+            for i, (header_re, boundary_re) in enumerate(_SOF_COMPARISON_SPECS):
+                j = 0
+                pos = 0
+                while True:
+                    header = header_re.search(section_text, pos)
+                    if header is None:
+                        break
+                    end = _span_end(section_text, boundary_re, header.end())
+                    if end < header.end():
+                        break
+                    subsection_name = f"comparison_{i+1}_{j+1}" if j > 0 else f"comparison_{i+1}"
+                    content = section_text[header.end():end].strip()
+                    if content and len(content) > 20:
+                        subsections[subsection_name] = content
+                    j += 1
+                    pos = end
+
         # If no structured tables found, try to extract any table-like content
         if not subsections:
             # Look for table content patterns
-            table_patterns = [
-                r'Patient or population:.*?(?=\n(?:Background|$))',
-                r'Setting:.*?(?=\n(?:Background|$))',
-                r'Intervention:.*?(?=\n(?:Background|$))',
-                r'Comparison:.*?(?=\n(?:Background|$))',
-                r'Outcomes\s*\n.*?(?=\n(?:Background|$))'
-            ]
-            
-            for i, pattern in enumerate(table_patterns):
-                match = re.search(pattern, section_text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    content = match.group(0).strip()
-                    if content and len(content) > 20:
-                        subsections[f"table_content_{i+1}"] = content
-        
+            for i, header_re in enumerate(_SOF_TABLE_HEADER_RES):
+                header = header_re.search(section_text)
+                if header is None:
+                    continue
+                end = _span_end(section_text, _SOF_TABLE_BOUNDARY_RE, header.end())
+                if end < header.end():
+                    continue
+                content = section_text[header.start():end].strip()
+                if content and len(content) > 20:
+                    subsections[f"table_content_{i+1}"] = content
+
         return subsections
@@ -6,89 +6,267 @@ temporal information, and quality assessments, following single responsibility p
 """
 
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from src.core.data_models import (
     CleanedContent, ExtractedSections, PicoElements,
     EnrichedMetadata, MedicalEntities, StudyDesign
 )
 
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _compile_ignorecase(raw: str):
+    """Compile a case-insensitive pattern, through re2's linear-time DFA when available."""
+    if re2 is not None:
+        try:
+            # re2 takes flags inline rather than as compile() arguments
+            return re2.compile('(?i)' + raw)
+        except re2.error:
+            pass
+    return re.compile(raw, re.IGNORECASE)
+
+# Entity keyword terms, scanned case-insensitively against raw section text.
+_CONDITION_TERMS = (
+    'asthma', 'diabetes', 'hypertension', 'depression', 'anxiety',
+    'cancer', 'stroke', 'heart disease', 'pneumonia', 'infection',
+    'allergy', 'arthritis', 'epilepsy', 'migraine', 'obesity',
+    'chronic pain', 'fibromyalgia', 'COPD', 'heart failure'
+)
+
+_DRUG_TERMS = (
+    'aspirin', 'ibuprofen', 'acetaminophen', 'paracetamol',
+    'prednisone', 'dexamethasone', 'hydrocortisone',
+    'antibiotic', 'antiviral', 'antifungal',
+    'antihistamine', 'antidepressant', 'antipsychotic',
+    'beta-blocker', 'ACE inhibitor', 'statin'
+)
+
+_PROCEDURE_TERMS = (
+    'surgery', 'operation', 'procedure', 'intervention',
+    'biopsy', 'endoscopy', 'colonoscopy', 'laparoscopy',
+    'radiotherapy', 'chemotherapy', 'immunotherapy',
+    'physical therapy', 'occupational therapy', 'speech therapy'
+)
+
+_OUTCOME_TERMS = (
+    'quality of life', 'mortality', 'morbidity', 'survival',
+    'pain relief', 'symptom improvement', 'functional status',
+    'adverse effects', 'side effects', 'complications',
+    'hospitalization', 'readmission', 'length of stay'
+)
+
+def _entity_scanner(terms):
+    """
+    Build a one-pass case-insensitive literal scanner for an entity category.
+
+    A combined alternation compiled with IGNORECASE scans the raw section
+    text directly, so no lowercased copy of the content is allocated.
+    Longer terms are ordered first so no term shadows another; the scanner
+    returns the set of lowercased terms present.
+    """
+    union = _compile_ignorecase(
+        '|'.join(sorted(map(re.escape, terms), key=len, reverse=True))
+    )
+
+    def scan(text, _findall=union.findall):
+        return {match.lower() for match in _findall(text)}
+    return scan
+
+
+_find_conditions = _entity_scanner(_CONDITION_TERMS)
+_find_drugs = _entity_scanner(_DRUG_TERMS)
+_find_procedures = _entity_scanner(_PROCEDURE_TERMS)
+_find_outcomes = _entity_scanner(_OUTCOME_TERMS)
+
+# Display forms computed once at import rather than per document
+_TITLE_CASE = {
+    term.lower(): term.title()
+    for term in _CONDITION_TERMS + _DRUG_TERMS + _PROCEDURE_TERMS + _OUTCOME_TERMS
+}
+
+# All four entity categories fused into one Aho-Corasick automaton so each
+# section is streamed once instead of once per category. The automaton is
+# case-sensitive, so it runs over one lowercased copy of the section; hits
+# report (category, term) pairs for bucketing. Falls back to the
+# per-category scanners when pyahocorasick is unavailable.
+if ahocorasick is not None:
+    _ENTITY_AUTOMATON = ahocorasick.Automaton()
+    for _category, _terms in (
+        ('conditions', _CONDITION_TERMS),
+        ('drugs', _DRUG_TERMS),
+        ('procedures', _PROCEDURE_TERMS),
+        ('outcomes', _OUTCOME_TERMS),
+    ):
+        for _term in _terms:
+            _ENTITY_AUTOMATON.add_word(_term.lower(), (_category, _term.lower()))
+    _ENTITY_AUTOMATON.make_automaton()
+    del _category, _terms, _term
+else:
+    _ENTITY_AUTOMATON = None
+
+# All publication-date shapes fused into one alternation so a document is
+# scanned once instead of once per pattern; the named group that fired
+# selects the normalization branch
+_PUB_DATE_RE = _compile_ignorecase(
+    r'(?:Version published|Publication date|Date published|First published'
+    r'|Published(?: online)?):\s*(?P<labeled>\d{1,2}\s+\w+\s+\d{4})'
+    r'|(?P<trailed>\d{1,2}\s+\w+\s+\d{4})\s*(?:Version history|Published)'
+    r'|(?P<iso>\d{4}-\d{2}-\d{2})'
+    r'|(?P<us>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<dash>\d{1,2}-\d{1,2}-\d{4})'
+)
+
+# Fallback date cached in a 60-second window: across a batch run the
+# formatted "today" is effectively constant, so the repeated datetime.now()
+# and strftime calls are skipped on cache hits
+_today_cached = (0.0, '')
+
+
+def _today() -> str:
+    global _today_cached
+    now = time.monotonic()
+    stamp, value = _today_cached
+    if not value or now - stamp > 60.0:
+        value = datetime.now().strftime('%Y-%m-%d')
+        _today_cached = (now, value)
+    return value
+
+
+# Topic-name mappings frozen at module scope: lookups skip the per-call
+# class-attribute walk, and MappingProxyType keeps them read-only
+_MEDICAL_SPECIALTY_MAPPING = MappingProxyType({
+    'allergy & intolerance': 'Allergy and Immunology',
+    'cancer': 'Oncology',
+    'heart & circulation': 'Cardiology',
+    'mental health': 'Psychiatry',
+    'child health': 'Pediatrics',
+    'neonatal care': 'Neonatology',
+    'neurology': 'Neurology',
+    'infectious disease': 'Infectious Diseases',
+    'lungs & airways': 'Pulmonology',
+    'skin disorders': 'Dermatology',
+    'urology': 'Urology',
+    'dentistry & oral health': 'Dentistry',
+    'rheumatology': 'Rheumatology',
+    'gastroenterology & hepatology': 'Gastroenterology',
+    'ear, nose & throat': 'Otolaryngology',
+    'wounds': 'Wound Care',
+    'complementary & alternative medicine': 'Complementary Medicine',
+    'developmental, psychosocial & learning problems': 'Developmental Medicine',
+    'genetic disorders': 'Medical Genetics',
+    'reproductive & sexual health': 'Reproductive Medicine'
+})
+
+_CONDITION_CATEGORY_MAPPING = MappingProxyType({
+    'allergy & intolerance': 'Immune System',
+    'cancer': 'Oncological',
+    'heart & circulation': 'Cardiovascular',
+    'mental health': 'Psychiatric',
+    'child health': 'Pediatric',
+    'neonatal care': 'Neonatal',
+    'neurology': 'Neurological',
+    'infectious disease': 'Infectious',
+    'lungs & airways': 'Respiratory',
+    'skin disorders': 'Dermatological',
+    'urology': 'Urological',
+    'dentistry & oral health': 'Oral Health',
+    'rheumatology': 'Rheumatological',
+    'gastroenterology & hepatology': 'Gastrointestinal',
+    'ear, nose & throat': 'ENT',
+    'wounds': 'Wound Care',
+    'complementary & alternative medicine': 'Alternative Medicine',
+    'developmental, psychosocial & learning problems': 'Developmental',
+    'genetic disorders': 'Genetic',
+    'reproductive & sexual health': 'Reproductive'
+})
+
+
+# Topic names repeat across a batch, so the specialty/category lookups are
+# memoized: cache hits skip the lowercasing allocation and dict probes
+@lru_cache(maxsize=64)
+def _map_specialty_cached(topic_name: str) -> str:
+    return _MEDICAL_SPECIALTY_MAPPING.get(topic_name.lower(), 'General Medicine')
+
+
+@lru_cache(maxsize=64)
+def _map_category_cached(topic_name: str) -> str:
+    return _CONDITION_CATEGORY_MAPPING.get(topic_name.lower(), 'General')
+
+
+# Study-design markers fused into one pattern so each section is scanned
+# once instead of three times over a joined copy of every section
+_EVIDENCE_TERM_LEVELS = {
+    'systematic review': 'High',
+    'cochrane review': 'High',
+    'meta-analysis': 'High',
+    'randomized controlled trial': 'Moderate',
+    'randomised controlled trial': 'Moderate',
+    'rct': 'Moderate',
+    'observational study': 'Low',
+    'cohort study': 'Low',
+    'case-control study': 'Low',
+}
+_EVIDENCE_RE = _compile_ignorecase('|'.join(map(re.escape, _EVIDENCE_TERM_LEVELS)))
+_EVIDENCE_RANK = {'High': 0, 'Moderate': 1, 'Low': 2, 'Unknown': 3}
+
+# Intervention-type keywords fused into one pattern whose named groups
+# identify the type: one search classifies the intervention text, with
+# ties at the same position broken in the declaration order below
+_INTERVENTION_TYPE_TERMS = {
+    'pharmacological': (
+        'drug', 'medication', 'therapy', 'treatment', 'pharmaceutical',
+        'antihistamine', 'corticosteroid', 'antibiotic', 'antiviral'
+    ),
+    'surgical': (
+        'surgery', 'surgical', 'operation', 'procedure', 'intervention',
+        'excision', 'resection', 'repair', 'reconstruction'
+    ),
+    'behavioral': (
+        'behavioral', 'psychological', 'cognitive', 'therapy', 'intervention',
+        'counseling', 'education', 'training', 'support'
+    ),
+    'environmental': (
+        'environmental', 'dehumidifier', 'ventilation', 'air quality',
+        'home environment', 'workplace', 'climate'
+    ),
+    'diagnostic': (
+        'diagnostic', 'screening', 'test', 'assessment', 'evaluation',
+        'measurement', 'monitoring'
+    )
+}
+
+_INTERVENTION_TYPE_RE = _compile_ignorecase('|'.join(
+    '(?P<{}>{})'.format(intervention_type, '|'.join(map(re.escape, terms)))
+    for intervention_type, terms in _INTERVENTION_TYPE_TERMS.items()
+))
+
 
 class MetadataEnricher:
     """Enriches metadata with medical classifications and additional information."""
     
-    # Medical specialty mapping based on topic names
-    MEDICAL_SPECIALTY_MAPPING = {
-        'allergy & intolerance': 'Allergy and Immunology',
-        'cancer': 'Oncology',
-        'heart & circulation': 'Cardiology',
-        'mental health': 'Psychiatry',
-        'child health': 'Pediatrics',
-        'neonatal care': 'Neonatology',
-        'neurology': 'Neurology',
-        'infectious disease': 'Infectious Diseases',
-        'lungs & airways': 'Pulmonology',
-        'skin disorders': 'Dermatology',
-        'urology': 'Urology',
-        'dentistry & oral health': 'Dentistry',
-        'rheumatology': 'Rheumatology',
-        'gastroenterology & hepatology': 'Gastroenterology',
-        'ear, nose & throat': 'Otolaryngology',
-        'wounds': 'Wound Care',
-        'complementary & alternative medicine': 'Complementary Medicine',
-        'developmental, psychosocial & learning problems': 'Developmental Medicine',
-        'genetic disorders': 'Medical Genetics',
-        'reproductive & sexual health': 'Reproductive Medicine'
-    }
-    
-    # Condition category mapping
-    CONDITION_CATEGORY_MAPPING = {
-        'allergy & intolerance': 'Immune System',
-        'cancer': 'Oncological',
-        'heart & circulation': 'Cardiovascular',
-        'mental health': 'Psychiatric',
-        'child health': 'Pediatric',
-        'neonatal care': 'Neonatal',
-        'neurology': 'Neurological',
-        'infectious disease': 'Infectious',
-        'lungs & airways': 'Respiratory',
-        'skin disorders': 'Dermatological',
-        'urology': 'Urological',
-        'dentistry & oral health': 'Oral Health',
-        'rheumatology': 'Rheumatological',
-        'gastroenterology & hepatology': 'Gastrointestinal',
-        'ear, nose & throat': 'ENT',
-        'wounds': 'Wound Care',
-        'complementary & alternative medicine': 'Alternative Medicine',
-        'developmental, psychosocial & learning problems': 'Developmental',
-        'genetic disorders': 'Genetic',
-        'reproductive & sexual health': 'Reproductive'
-    }
-    
-    # Intervention type patterns
-    INTERVENTION_TYPE_PATTERNS = {
-        'pharmacological': [
-            r'drug', r'medication', r'therapy', r'treatment', r'pharmaceutical',
-            r'antihistamine', r'corticosteroid', r'antibiotic', r'antiviral'
-        ],
-        'surgical': [
-            r'surgery', r'surgical', r'operation', r'procedure', r'intervention',
-            r'excision', r'resection', r'repair', r'reconstruction'
-        ],
-        'behavioral': [
-            r'behavioral', r'psychological', r'cognitive', r'therapy', r'intervention',
-            r'counseling', r'education', r'training', r'support'
-        ],
-        'environmental': [
-            r'environmental', r'dehumidifier', r'ventilation', r'air quality',
-            r'home environment', r'workplace', r'climate'
-        ],
-        'diagnostic': [
-            r'diagnostic', r'screening', r'test', r'assessment', r'evaluation',
-            r'measurement', r'monitoring'
-        ]
-    }
-    
+    # Aliases kept for external readers; the mappings live at module scope
+    MEDICAL_SPECIALTY_MAPPING = _MEDICAL_SPECIALTY_MAPPING
+    CONDITION_CATEGORY_MAPPING = _CONDITION_CATEGORY_MAPPING
+
+
     def enrich_metadata(
         self,
         cleaned_content: CleanedContent,
@@ -133,176 +311,154 @@ class MetadataEnricher:
             subsection_count=sections.subsection_count,
             full_content=cleaned_content.full_content
         )
-    
+
+    def enrich_metadata_batch(self, jobs: List[tuple],
+                              workers: Optional[int] = None) -> List[EnrichedMetadata]:
+        """
+        Enrich metadata for many documents in parallel.
+
+        Enrichment is pure CPU work (regex and automaton scans) over
+        independent documents, so it is dispatched to a process pool; on
+        fork-based platforms each worker inherits the precompiled patterns
+        and the entity automaton from module import.
+
+        Args:
+            jobs: List of (cleaned_content, sections, pico_elements,
+                source_file) tuples, one per document
+            workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            List of EnrichedMetadata, in input order
+        """
+        # Pool spawn/teardown costs more than it saves on tiny batches
+        if len(jobs) < 2 or workers == 1:
+            return [self.enrich_metadata(*job) for job in jobs]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._enrich_one, jobs, chunksize=16))
+
+    def _enrich_one(self, job: tuple) -> EnrichedMetadata:
+        """Unpack one batch entry for the process pool."""
+        return self.enrich_metadata(*job)
+
     def _extract_medical_entities(self, sections: ExtractedSections) -> MedicalEntities:
         """Extract medical entities from sections."""
-        conditions = self._extract_conditions(sections)
-        drugs = self._extract_drugs(sections)
-        procedures = self._extract_procedures(sections)
-        outcomes = self._extract_outcomes(sections)
-        
+        if _ENTITY_AUTOMATON is None:
+            return MedicalEntities(
+                conditions=self._extract_conditions(sections),
+                drugs=self._extract_drugs(sections),
+                procedures=self._extract_procedures(sections),
+                outcomes=self._extract_outcomes(sections)
+            )
+
+        # One automaton pass per section covers every category at once
+        buckets = {'conditions': set(), 'drugs': set(), 'procedures': set(), 'outcomes': set()}
+        for section in sections.sections.values():
+            for _, (category, term) in _ENTITY_AUTOMATON.iter(section.content.lower()):
+                buckets[category].add(term)
+
         return MedicalEntities(
-            conditions=conditions,
-            drugs=drugs,
-            procedures=procedures,
-            outcomes=outcomes
+            conditions=[_TITLE_CASE[term] for term in buckets['conditions']],
+            drugs=[_TITLE_CASE[term] for term in buckets['drugs']],
+            procedures=[_TITLE_CASE[term] for term in buckets['procedures']],
+            outcomes=[_TITLE_CASE[term] for term in buckets['outcomes']]
         )
     
     def _extract_conditions(self, sections: ExtractedSections) -> List[str]:
         """Extract medical conditions from sections."""
-        conditions = []
-        
-        # Common condition patterns
-        condition_patterns = [
-            r'asthma', r'diabetes', r'hypertension', r'depression', r'anxiety',
-            r'cancer', r'stroke', r'heart disease', r'pneumonia', r'infection',
-            r'allergy', r'arthritis', r'epilepsy', r'migraine', r'obesity',
-            r'chronic pain', r'fibromyalgia', r'COPD', r'heart failure'
-        ]
-        
+        conditions = set()
+
         for section in sections.sections.values():
-            content = section.content.lower()
-            for pattern in condition_patterns:
-                if re.search(pattern, content):
-                    conditions.append(pattern.title())
-        
-        return list(set(conditions))
+            conditions.update(_find_conditions(section.content))
+
+        return [_TITLE_CASE[term] for term in conditions]
     
     def _extract_drugs(self, sections: ExtractedSections) -> List[str]:
         """Extract drug names from sections."""
-        drugs = []
-        
-        # Common drug patterns
-        drug_patterns = [
-            r'aspirin', r'ibuprofen', r'acetaminophen', r'paracetamol',
-            r'prednisone', r'dexamethasone', r'hydrocortisone',
-            r'antibiotic', r'antiviral', r'antifungal',
-            r'antihistamine', r'antidepressant', r'antipsychotic',
-            r'beta-blocker', r'ACE inhibitor', r'statin'
-        ]
-        
+        drugs = set()
+
         for section in sections.sections.values():
-            content = section.content.lower()
-            for pattern in drug_patterns:
-                if re.search(pattern, content):
-                    drugs.append(pattern.title())
-        
-        return list(set(drugs))
+            drugs.update(_find_drugs(section.content))
+
+        return [_TITLE_CASE[term] for term in drugs]
     
     def _extract_procedures(self, sections: ExtractedSections) -> List[str]:
         """Extract medical procedures from sections."""
-        procedures = []
-        
-        # Common procedure patterns
-        procedure_patterns = [
-            r'surgery', r'operation', r'procedure', r'intervention',
-            r'biopsy', r'endoscopy', r'colonoscopy', r'laparoscopy',
-            r'radiotherapy', r'chemotherapy', r'immunotherapy',
-            r'physical therapy', r'occupational therapy', r'speech therapy'
-        ]
-        
+        procedures = set()
+
         for section in sections.sections.values():
-            content = section.content.lower()
-            for pattern in procedure_patterns:
-                if re.search(pattern, content):
-                    procedures.append(pattern.title())
-        
-        return list(set(procedures))
+            procedures.update(_find_procedures(section.content))
+
+        return [_TITLE_CASE[term] for term in procedures]
     
     def _extract_outcomes(self, sections: ExtractedSections) -> List[str]:
         """Extract outcome measures from sections."""
-        outcomes = []
-        
-        # Common outcome patterns
-        outcome_patterns = [
-            r'quality of life', r'mortality', r'morbidity', r'survival',
-            r'pain relief', r'symptom improvement', r'functional status',
-            r'adverse effects', r'side effects', r'complications',
-            r'hospitalization', r'readmission', r'length of stay'
-        ]
-        
+        outcomes = set()
+
         for section in sections.sections.values():
-            content = section.content.lower()
-            for pattern in outcome_patterns:
-                if re.search(pattern, content):
-                    outcomes.append(pattern.title())
-        
-        return list(set(outcomes))
+            outcomes.update(_find_outcomes(section.content))
+
+        return [_TITLE_CASE[term] for term in outcomes]
     
     def _map_medical_specialty(self, topic_name: str) -> str:
         """Map topic name to medical specialty."""
-        topic_lower = topic_name.lower()
-        return self.MEDICAL_SPECIALTY_MAPPING.get(topic_lower, 'General Medicine')
-    
+        return _map_specialty_cached(topic_name)
+
     def _map_condition_category(self, topic_name: str) -> str:
         """Map topic name to condition category."""
-        topic_lower = topic_name.lower()
-        return self.CONDITION_CATEGORY_MAPPING.get(topic_lower, 'General')
+        return _map_category_cached(topic_name)
     
     def _extract_publication_date(self, content: str) -> str:
         """Extract publication date from content."""
-        # Common patterns for publication dates in Cochrane reviews
-        date_patterns = [
-            r'Version published:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            r'Published:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            r'Publication date:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            r'Date published:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            r'(\d{1,2}\s+\w+\s+\d{4})\s*Version history',
-            r'Version published:\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})',
-            r'Published online:\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})',
-            r'First published:\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})',
-            r'(\d{1,2}\s+[A-Za-z]+\s+\d{4})\s*Published',
-            r'(\d{4}-\d{2}-\d{2})',  # ISO format
-            r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY format
-            r'(\d{1,2}-\d{1,2}-\d{4})'  # MM-DD-YYYY format
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
+        # One scan over the content; hits are taken in document order and
+        # normalized according to which alternative matched. The numeric
+        # shapes are guaranteed parseable by their patterns, so only the
+        # textual-month parse needs exception handling
+        for match in _PUB_DATE_RE.finditer(content):
+            kind = match.lastgroup
+            date_str = match.group(kind)
+            if kind == 'iso':
+                return date_str
+            elif kind == 'us':
+                parts = date_str.split('/')
+                return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
+            elif kind == 'dash':
+                parts = date_str.split('-')
+                return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
+
+            # Labeled dates like '12 May 2020': strptime handles the two
+            # expected month forms, with dateutil as the loose fallback
+            for fmt in ('%d %B %Y', '%d %b %Y'):
                 try:
-                    # Try to parse and standardize the date
-                    if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-                        return date_str
-                    elif re.match(r'\d{1,2}/\d{1,2}/\d{4}', date_str):
-                        parts = date_str.split('/')
-                        return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
-                    elif re.match(r'\d{1,2}-\d{1,2}-\d{4}', date_str):
-                        parts = date_str.split('-')
-                        return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
-                    else:
-                        # Try to parse common date formats
-                        from dateutil import parser
-                        parsed_date = parser.parse(date_str)
-                        return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    continue
-        
+                    return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+                except ValueError:
+                    pass
+            if _dateutil_parser is not None:
+                try:
+                    return _dateutil_parser.parse(date_str).strftime('%Y-%m-%d')
+                except (ValueError, TypeError, OverflowError):
+                    pass
+
         # If no date found, return current date as fallback
-        return datetime.now().strftime('%Y-%m-%d')
+        return _today()
     
     def _identify_intervention_type(self, pico_elements: PicoElements, sections: ExtractedSections) -> str:
         """Identify the primary intervention type."""
-        intervention_text = ' '.join(pico_elements.intervention).lower()
-        
-        for intervention_type, patterns in self.INTERVENTION_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, intervention_text):
-                    return intervention_type
-        
-        return 'Other'
+        intervention_text = ' '.join(pico_elements.intervention)
+
+        match = _INTERVENTION_TYPE_RE.search(intervention_text)
+        return match.lastgroup if match else 'Other'
     
     def _determine_evidence_level_from_content(self, sections: ExtractedSections) -> str:
         """Determine evidence level based on content analysis."""
-        # Look for study design indicators in the content
-        content_text = ' '.join([section.content for section in sections.sections.values()]).lower()
-        
-        if any(term in content_text for term in ['systematic review', 'cochrane review', 'meta-analysis']):
-            return 'High'
-        elif any(term in content_text for term in ['randomized controlled trial', 'rct', 'randomised controlled trial']):
-            return 'Moderate'
-        elif any(term in content_text for term in ['observational study', 'cohort study', 'case-control study']):
-            return 'Low'
-        else:
-            return 'Unknown'
+        # Look for study design indicators section by section, keeping the
+        # strongest level seen and returning as soon as High is found
+        best = 'Unknown'
+        for section in sections.sections.values():
+            for match in _EVIDENCE_RE.finditer(section.content):
+                level = _EVIDENCE_TERM_LEVELS[match.group(0).lower()]
+                if level == 'High':
+                    return 'High'
+                if _EVIDENCE_RANK[level] < _EVIDENCE_RANK[best]:
+                    best = level
+        return best
@@ -6,9 +6,126 @@ elements from Cochrane content, following single responsibility principle.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from src.core.data_models import ExtractedSections, PicoElements
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Cleanup patterns compiled once at import instead of per element
+_CLEAN_EDGES_RE = re.compile(r'^(?:the|a|an)\s+|\s+(?:and|or|but)\s*$', re.IGNORECASE)
+_PAREN_RE = re.compile(r'\(([^)]*)\)')
+
+
+@lru_cache(maxsize=8)
+def _picos_type_pattern(pico_type: str):
+    """Compile the structured-PICOs pattern for one pico type once."""
+    return re.compile(rf'{pico_type}\s*\([^)]*\)', re.IGNORECASE)
+
+
+_METACHARS = frozenset('\\[](){}?*+|^$.')
+
+# A pattern is a pure literal when it is just words joined by '\s+'
+_LITERAL_PATTERN_RE = re.compile(r'[a-z-]+(?:\\s\+[a-z-]+)*')
+
+
+def _build_literal_automaton(patterns):
+    """
+    Split the pure-literal patterns out of a pattern list and build an
+    Aho-Corasick automaton over their phrases, which finds every
+    occurrence of every phrase in a single pass over the text. Returns
+    (automaton, remaining_patterns); the automaton is None when
+    pyahocorasick is unavailable, leaving all patterns on the regex
+    path.
+    """
+    if ahocorasick is None:
+        return None, patterns
+
+    literals = []
+    remaining = []
+    for pattern in patterns:
+        if _LITERAL_PATTERN_RE.fullmatch(pattern):
+            literals.append(pattern.replace(r'\s+', ' '))
+        else:
+            remaining.append(pattern)
+
+    if not literals:
+        return None, patterns
+
+    automaton = ahocorasick.Automaton()
+    for phrase in literals:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton, remaining
+
+
+def _compile_category(patterns) -> tuple:
+    """Build one category's matchers: literal automaton + regex groups."""
+    automaton, remaining = _build_literal_automaton(patterns)
+    return automaton, _group_patterns(remaining)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Take the literal prefix of a raw pattern: everything before the
+    first regex metachar, minus a trailing char made optional by '?' or
+    '*' (e.g. 'patients?...' yields 'patient').
+    """
+    literal = []
+    for i, char in enumerate(pattern):
+        if char in _METACHARS:
+            if char in '?*' and literal:
+                literal.pop()
+            break
+        literal.append(char)
+    return ''.join(literal).lower()
+
+
+def _group_patterns(patterns) -> tuple:
+    """
+    Compile a pattern list into per-leading-character alternations.
+
+    Patterns sharing their leading literal are merged with '|', so one
+    scan covers the whole group while the engine keeps a literal-prefix
+    fast path for skipping non-matching text. A single mega-alternation
+    would lose that prefilter, so the groups stay per leading character.
+
+    Each alternation goes through re2's linear-time engine when it is
+    installed, with the stdlib compile as fallback. Every compiled
+    group is paired with its members' literal prefixes so callers can
+    reject the whole group with plain substring probes before the
+    engine runs.
+    """
+    buckets = {}
+    for pattern in patterns:
+        buckets.setdefault(pattern[0].lower(), []).append(pattern)
+
+    compiled = []
+    for group in buckets.values():
+        literals = tuple(filter(None, (_literal_prefix(p) for p in group)))
+        raw = '|'.join(f'(?:{p})' for p in group)
+        pat = None
+        if re2 is not None:
+            try:
+                # re2 takes flags inline rather than as compile() arguments
+                pat = re2.compile('(?s)' + raw)
+            except re2.error:
+                pat = None
+        compiled.append(
+            (literals if len(literals) == len(group) else (),
+             pat if pat is not None else re.compile(raw, re.DOTALL))
+        )
+    return tuple(compiled)
+
 
 class PicoExtractor:
     """Extracts PICO elements from extracted sections."""
@@ -97,197 +214,165 @@ class PicoExtractor:
         r'hospital\s+length\s+of\s+stay',
         r'readmission\s+rate'
     ]
-    
+
+    # Matchers built once at class definition: pure-literal patterns go
+    # into one Aho-Corasick automaton per category (a single pass finds
+    # them all), while the remaining patterns are merged into one
+    # alternation per leading character so each section is scanned a
+    # handful of times instead of 15-21 times per category
+    _COMPILED_PATTERNS = {
+        'population': _compile_category(POPULATION_PATTERNS),
+        'intervention': _compile_category(INTERVENTION_PATTERNS),
+        'comparison': _compile_category(COMPARISON_PATTERNS),
+        'outcome': _compile_category(OUTCOME_PATTERNS),
+    }
+
+    # Prose sections scanned per category, in the order their hits are
+    # collected (structured PICOs hits always come first)
+    _SECTION_ORDER = {
+        'population': ('background', 'methods', 'abstract'),
+        'intervention': ('methods', 'background', 'abstract'),
+        'comparison': ('methods', 'background', 'abstract'),
+        'outcome': ('methods', 'results', 'background', 'abstract'),
+    }
+
     def extract_pico_elements(self, sections: ExtractedSections) -> PicoElements:
         """
         Extract PICO elements from extracted sections.
-        
+
         Args:
             sections: Extracted sections containing content
-            
+
         Returns:
             PicoElements with extracted PICO information
         """
-        population = self._extract_population(sections)
-        intervention = self._extract_intervention(sections)
-        comparison = self._extract_comparison(sections)
-        outcome = self._extract_outcome(sections)
-        
+        # Bind the hot structures to locals once: attribute and class
+        # dict lookups inside the loops become LOAD_FAST
+        available = sections.sections
+        compiled = self._COMPILED_PATTERNS
+        section_order = self._SECTION_ORDER
+        extract = self._extract_with_patterns
+
+        picos_content = available['picos'].content if 'picos' in available else None
+
+        # A complete structured PICOs section settles a category on its
+        # own: its elements come first in collection order, so once it
+        # fills the 10-element cap no prose hit can displace them
+        elements = {}
+        pending = []
+        for category in section_order:
+            collected = []
+            if picos_content is not None:
+                collected.extend(self._extract_from_picos_section(picos_content, category))
+            cleaned = self._clean_and_deduplicate(collected)
+            if len(cleaned) >= 10:
+                elements[category] = cleaned
+            else:
+                pending.append((category, collected))
+
+        # Scan each section once for every still-open category that
+        # wants it, while its text is hot in cache, bucketing hits per
+        # (category, section)
+        hits = {}
+        if pending:
+            open_categories = {category for category, _ in pending}
+            for name, section in available.items():
+                text = section.content
+                for category, matchers in compiled.items():
+                    if category in open_categories and name in section_order[category]:
+                        hits[(category, name)] = extract(text, matchers)
+
+        # Assemble the open categories in their established collection order
+        for category, collected in pending:
+            for name in section_order[category]:
+                collected.extend(hits.get((category, name), ()))
+            elements[category] = self._clean_and_deduplicate(collected)
+
         return PicoElements(
-            population=population,
-            intervention=intervention,
-            comparison=comparison,
-            outcome=outcome
+            population=elements['population'],
+            intervention=elements['intervention'],
+            comparison=elements['comparison'],
+            outcome=elements['outcome']
         )
-    
-    def _extract_population(self, sections: ExtractedSections) -> List[str]:
-        """Extract population elements from sections."""
-        population_elements = []
-        
-        # Check PICOs section first (if available)
-        if 'picos' in sections.sections:
-            picos_content = sections.sections['picos'].content
-            population_elements.extend(self._extract_from_picos_section(picos_content, 'population'))
-        
-        # Check background section (most common for population info)
-        if 'background' in sections.sections:
-            background_content = sections.sections['background'].content
-            population_elements.extend(self._extract_with_patterns(background_content, self.POPULATION_PATTERNS))
-        
-        # Check methods section (often contains participant criteria)
-        if 'methods' in sections.sections:
-            methods_content = sections.sections['methods'].content
-            population_elements.extend(self._extract_with_patterns(methods_content, self.POPULATION_PATTERNS))
-        
-        # Check abstract section (if available)
-        if 'abstract' in sections.sections:
-            abstract_content = sections.sections['abstract'].content
-            population_elements.extend(self._extract_with_patterns(abstract_content, self.POPULATION_PATTERNS))
-        
-        return self._clean_and_deduplicate(population_elements)
-    
-    def _extract_intervention(self, sections: ExtractedSections) -> List[str]:
-        """Extract intervention elements from sections."""
-        intervention_elements = []
-        
-        # Check PICOs section first (if available)
-        if 'picos' in sections.sections:
-            picos_content = sections.sections['picos'].content
-            intervention_elements.extend(self._extract_from_picos_section(picos_content, 'intervention'))
-        
-        # Check methods section (often contains intervention details)
-        if 'methods' in sections.sections:
-            methods_content = sections.sections['methods'].content
-            intervention_elements.extend(self._extract_with_patterns(methods_content, self.INTERVENTION_PATTERNS))
-        
-        # Check background section (intervention description)
-        if 'background' in sections.sections:
-            background_content = sections.sections['background'].content
-            intervention_elements.extend(self._extract_with_patterns(background_content, self.INTERVENTION_PATTERNS))
-        
-        # Check abstract section (if available)
-        if 'abstract' in sections.sections:
-            abstract_content = sections.sections['abstract'].content
-            intervention_elements.extend(self._extract_with_patterns(abstract_content, self.INTERVENTION_PATTERNS))
-        
-        return self._clean_and_deduplicate(intervention_elements)
-    
-    def _extract_comparison(self, sections: ExtractedSections) -> List[str]:
-        """Extract comparison elements from sections."""
-        comparison_elements = []
-        
-        # Check PICOs section first (if available)
-        if 'picos' in sections.sections:
-            picos_content = sections.sections['picos'].content
-            comparison_elements.extend(self._extract_from_picos_section(picos_content, 'comparison'))
-        
-        # Check methods section (often contains comparison details)
-        if 'methods' in sections.sections:
-            methods_content = sections.sections['methods'].content
-            comparison_elements.extend(self._extract_with_patterns(methods_content, self.COMPARISON_PATTERNS))
-        
-        # Check background section (comparison description)
-        if 'background' in sections.sections:
-            background_content = sections.sections['background'].content
-            comparison_elements.extend(self._extract_with_patterns(background_content, self.COMPARISON_PATTERNS))
-        
-        # Check abstract section (if available)
-        if 'abstract' in sections.sections:
-            abstract_content = sections.sections['abstract'].content
-            comparison_elements.extend(self._extract_with_patterns(abstract_content, self.COMPARISON_PATTERNS))
-        
-        return self._clean_and_deduplicate(comparison_elements)
-    
-    def _extract_outcome(self, sections: ExtractedSections) -> List[str]:
-        """Extract outcome elements from sections."""
-        outcome_elements = []
-        
-        # Check PICOs section first (if available)
-        if 'picos' in sections.sections:
-            picos_content = sections.sections['picos'].content
-            outcome_elements.extend(self._extract_from_picos_section(picos_content, 'outcome'))
-        
-        # Check methods section (often contains outcome measures)
-        if 'methods' in sections.sections:
-            methods_content = sections.sections['methods'].content
-            outcome_elements.extend(self._extract_with_patterns(methods_content, self.OUTCOME_PATTERNS))
-        
-        # Check results section (outcome results)
-        if 'results' in sections.sections:
-            results_content = sections.sections['results'].content
-            outcome_elements.extend(self._extract_with_patterns(results_content, self.OUTCOME_PATTERNS))
-        
-        # Check background section (outcome description)
-        if 'background' in sections.sections:
-            background_content = sections.sections['background'].content
-            outcome_elements.extend(self._extract_with_patterns(background_content, self.OUTCOME_PATTERNS))
-        
-        # Check abstract section (if available)
-        if 'abstract' in sections.sections:
-            abstract_content = sections.sections['abstract'].content
-            outcome_elements.extend(self._extract_with_patterns(abstract_content, self.OUTCOME_PATTERNS))
-        
-        return self._clean_and_deduplicate(outcome_elements)
-    
+
+
     def _extract_from_picos_section(self, content: str, pico_type: str) -> List[str]:
         """Extract PICO elements from a structured PICOs section."""
         elements = []
-        
+
         # Look for specific PICO type in the content
-        pattern = re.compile(rf'{pico_type}\s*\([^)]*\)', re.IGNORECASE)
+        pattern = _picos_type_pattern(pico_type)
         matches = pattern.findall(content)
-        
+
         for match in matches:
             # Extract content within parentheses
-            inner_content = re.search(r'\(([^)]*)\)', match)
+            inner_content = _PAREN_RE.search(match)
             if inner_content:
                 elements.append(inner_content.group(1).strip())
-        
+
         return elements
-    
-    def _extract_with_patterns(self, content: str, patterns: List[str]) -> List[str]:
-        """Extract elements using regex patterns."""
+
+    def _extract_with_patterns(self, content: str, matchers) -> List[str]:
+        """Extract elements using one category's precompiled matchers."""
+        automaton, patterns = matchers
         elements = []
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # If pattern has groups, take the first non-empty group
-                    element = next((group for group in match if group.strip()), '')
-                else:
-                    element = match
-                
-                if element and len(element.strip()) > 5:  # Minimum length filter
-                    elements.append(element.strip())
-        
+
+        # Every matcher runs against one lowered copy: the patterns are
+        # all-lowercase, so dropping IGNORECASE turns the engines' hot
+        # loops into plain byte comparison, and case-folding happens
+        # once per section instead of once per probed position
+        content_lower = content.lower()
+
+        # All literal phrases are found in a single automaton pass
+        if automaton is not None:
+            for _, phrase in automaton.iter(content_lower):
+                if len(phrase) > 5:  # Minimum length filter
+                    elements.append(phrase)
+                    if len(elements) >= 10:  # Downstream cap per category
+                        return elements
+
+        # finditer yields matches lazily, so no intermediate list is
+        # built and the scan can stop once the downstream cap is covered
+        for literals, pattern in patterns:
+            if literals and not any(lit in content_lower for lit in literals):
+                continue
+            for match in pattern.finditer(content_lower):
+                element = match.group(0).strip()
+                if element and len(element) > 5:  # Minimum length filter
+                    elements.append(element)
+                    if len(elements) >= 10:  # Downstream cap per category
+                        return elements
+
         return elements
     
     def _clean_and_deduplicate(self, elements: List[str]) -> List[str]:
         """Clean and deduplicate extracted elements."""
         if not elements:
             return []
-        
-        # Clean elements
-        cleaned = []
-        for element in elements:
-            # Remove extra whitespace
-            cleaned_element = re.sub(r'\s+', ' ', element.strip())
-            
-            # Remove common prefixes/suffixes
-            cleaned_element = re.sub(r'^(the|a|an)\s+', '', cleaned_element, flags=re.IGNORECASE)
-            cleaned_element = re.sub(r'\s+(and|or|but)\s*$', '', cleaned_element, flags=re.IGNORECASE)
-            
-            # Minimum length check
-            if len(cleaned_element) > 5:
-                cleaned.append(cleaned_element)
-        
-        # Remove duplicates while preserving order
+
+        # Clean and deduplicate in one pass, stopping at the 10-element
+        # cap so trailing matches are never regex-cleaned just to be
+        # thrown away
         seen = set()
+        raw_seen = set()
         unique_elements = []
-        for element in cleaned:
-            if element.lower() not in seen:
-                seen.add(element.lower())
-                unique_elements.append(element)
-        
-        return unique_elements[:10]  # Limit to 10 elements per category
\ No newline at end of file
+        for element in elements:
+            # A raw duplicate would clean to a duplicate anyway, so skip
+            # it before paying for the substitutions
+            raw_key = element.lower()
+            if raw_key in raw_seen:
+                continue
+            raw_seen.add(raw_key)
+
+            # Collapse whitespace with str.split (pure C), then strip
+            # the common prefix and suffix in one combined pass
+            cleaned_element = _CLEAN_EDGES_RE.sub('', ' '.join(element.split()))
+
+            # Minimum length check, then dedupe preserving order
+            if len(cleaned_element) > 5 and cleaned_element.lower() not in seen:
+                seen.add(cleaned_element.lower())
+                unique_elements.append(cleaned_element)
+                if len(unique_elements) == 10:  # Limit per category
+                    break
+
+        return unique_elements
\ No newline at end of file
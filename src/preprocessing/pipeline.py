@@ -6,7 +6,11 @@ following clean code principles and single responsibility principle.
 """
 
 import json
+import mmap
 import time
+from collections import Counter
+from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -20,6 +24,29 @@ from .pico_extractor import PicoExtractor
 from .metadata_enricher import MetadataEnricher
 from .quality_validator import QualityValidator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this size the mmap setup cost dominates; just read the bytes.
+_MMAP_THRESHOLD_BYTES = 4096
+
+# One pipeline per worker process, built by the pool initializer and
+# reused for every file that worker handles
+_worker_pipeline = None
+
+
+def _init_worker():
+    """Build the per-process pipeline once per pool worker."""
+    global _worker_pipeline
+    _worker_pipeline = CochraneProcessingPipeline()
+
+
+def _process_one(file_path: Path) -> 'ProcessingResult':
+    """Process a single file in a pool worker."""
+    return _worker_pipeline.process_file(file_path)
+
 
 class CochraneProcessingPipeline:
     """Main orchestrator for the Cochrane data processing pipeline."""
@@ -79,14 +106,16 @@ class CochraneProcessingPipeline:
                 return ProcessingResult(
                     success=False,
                     errors=quality_validation.errors,
+                    warnings=quality_validation.warnings,
                     processing_time=time.time() - start_time
                 )
-            
+
             processing_time = time.time() - start_time
-            
+
             return ProcessingResult(
                 success=True,
                 document=processed_document,
+                warnings=quality_validation.warnings,
                 processing_time=processing_time
             )
             
@@ -97,125 +126,202 @@ class CochraneProcessingPipeline:
                 processing_time=time.time() - start_time
             )
     
-    def process_directory(self, input_dir: Path, output_dir: Path, log_dir: Path, limit: Optional[int] = None) -> Dict[str, Any]:
+    def process_directory(self, input_dir: Path, output_dir: Path, log_dir: Path,
+                          limit: Optional[int] = None,
+                          workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Process all JSON files in a directory with log tracking.
-        
+
+        Files are independent CPU-bound units, so they are fanned out to a
+        process pool; log writes, statistics and output saving stay on the
+        main process to avoid contention.
+
         Args:
             input_dir: Directory containing JSON files
             output_dir: Directory to save processed files
             log_dir: Directory to store processing logs
             limit: Optional limit on number of files to process
-            
+            workers: Number of worker processes (default: CPU count)
+
         Returns:
             Dictionary with processing statistics and results
         """
         # Create output and log directories
         output_dir.mkdir(exist_ok=True, parents=True)
         log_dir.mkdir(exist_ok=True, parents=True)
-        
+
         # Load existing processing log
         processed_files_log = self._load_processed_files(log_dir)
         log_file = self._get_log_file_path(log_dir)
-        
+
         # Find JSON files
         json_files = list(input_dir.glob('*.json'))
         if limit:
             json_files = json_files[:limit]
-        
-        results = []
+
+        # Split already-processed files off before dispatching
+        to_process = []
         skipped_count = 0
-        
         for i, json_file in enumerate(json_files, 1):
-            filename = json_file.name
-            
-            # Check if file is already processed
-            if self._is_file_processed(processed_files_log, filename):
-                print(f"Skipping [{i}/{len(json_files)}]: {filename} (already processed)")
+            if self._is_file_processed(processed_files_log, json_file.name):
+                print(f"Skipping [{i}/{len(json_files)}]: {json_file.name} (already processed)")
                 skipped_count += 1
-                continue
-            
-            print(f"Processing [{i}/{len(json_files)}]: {filename}")
-            
-            result = self.process_file(json_file)
-            results.append(result)
-            
-            # Determine status and timestamp
-            status = "success" if result.success else "failed"
-            timestamp = datetime.now().isoformat()
-            
-            # Save entry to log
-            self._save_processed_file_entry(log_file, filename, status, timestamp)
-            
-            # Update processed files log in memory
-            processed_files_log[filename] = {
-                'filename': filename,
-                'timestamp': timestamp,
-                'status': status
-            }
-            
-            # Update statistics
-            self._update_stats(result)
-            
-            # Save successful results
-            if result.success and result.document:
-                self._save_processed_document(result.document, output_dir, json_file.stem)
-        
+            else:
+                to_process.append(json_file)
+
+        results = []
+        save_futures = []
+        # The per-file log is append-only JSONL: one tiny append per file
+        # instead of rewriting the whole JSON log every time. Document
+        # saves go through a small thread pool so write syscalls overlap
+        # with processing the next file (the GIL is released during IO);
+        # log writes stay on the main thread to keep resume state ordered
+        with open(self._get_log_jsonl_path(log_dir), 'a', encoding='utf-8') as log_fp, \
+                ThreadPoolExecutor(max_workers=2) as io_pool:
+            for json_file, result in self._run_processing_jobs(to_process, workers):
+                filename = json_file.name
+                results.append(result)
+
+                # Determine status and timestamp
+                status = "success" if result.success else "failed"
+                timestamp = datetime.now().isoformat()
+
+                # Append entry to the JSONL log
+                entry = {
+                    'filename': filename,
+                    'timestamp': timestamp,
+                    'status': status
+                }
+                if orjson is not None:
+                    log_fp.write(orjson.dumps(entry).decode() + '\n')
+                else:
+                    log_fp.write(json.dumps(entry) + '\n')
+                log_fp.flush()
+
+                # Update processed files log in memory
+                processed_files_log[filename] = entry
+
+                # Update statistics
+                self._update_stats(result)
+
+                # Save successful results
+                if result.success and result.document:
+                    save_futures.append(io_pool.submit(
+                        self._save_processed_document,
+                        result.document, output_dir, json_file.stem
+                    ))
+
+            # Surface any save failure before reporting success
+            for future in save_futures:
+                future.result()
+
+        # Consolidate the full picture into the summary JSON once per run
+        self._write_consolidated_log(log_file, processed_files_log)
+
         # Generate final report
         report = self._generate_processing_report(results, skipped_count)
-        
+
         return report
+
+    def _run_processing_jobs(self, json_files: List[Path], workers: Optional[int]):
+        """
+        Yield (file, result) pairs, processing in parallel when worthwhile.
+
+        Each pool worker builds its own pipeline once via the initializer
+        and reuses it for every file it handles; results are yielded as
+        they complete.
+        """
+        total = len(json_files)
+
+        # Pool spawn/teardown costs more than it saves on tiny batches
+        if total < 2 or workers == 1:
+            for i, json_file in enumerate(json_files, 1):
+                print(f"Processing [{i}/{total}]: {json_file.name}")
+                yield json_file, self.process_file(json_file)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {executor.submit(_process_one, jf): jf for jf in json_files}
+            for i, future in enumerate(as_completed(futures), 1):
+                json_file = futures[future]
+                print(f"Processing [{i}/{total}]: {json_file.name}")
+                yield json_file, future.result()
     
     def _load_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Load JSON file and return parsed data."""
         try:
+            if orjson is not None:
+                if file_path.stat().st_size < _MMAP_THRESHOLD_BYTES:
+                    return orjson.loads(file_path.read_bytes())
+                # Parse directly from the mapped pages instead of copying
+                # the whole file into a Python bytes object first.
+                with open(file_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                        with memoryview(mm) as view:
+                            return orjson.loads(view)
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             print(f"Error loading {file_path}: {e}")
             return None
     
     def _get_log_file_path(self, log_dir: Path) -> Path:
-        """Returns path to processing log JSON file."""
+        """Returns path to the consolidated processing log JSON file."""
         return log_dir / "processing_log.json"
-    
+
+    def _get_log_jsonl_path(self, log_dir: Path) -> Path:
+        """Returns path to the append-only per-file JSONL log."""
+        return log_dir / "processing_log.jsonl"
+
     def _load_processed_files(self, log_dir: Path) -> Dict[str, Dict]:
-        """Loads existing log file and returns dictionary of processed files keyed by filename."""
+        """
+        Loads processed-file entries keyed by filename.
+
+        The consolidated JSON is read first, then any newer entries from
+        the append-only JSONL (e.g. from an interrupted run that never
+        consolidated) are layered on top.
+        """
+        processed: Dict[str, Dict] = {}
+
         log_file = self._get_log_file_path(log_dir)
-        
-        if not log_file.exists():
-            return {}
-        
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-                return log_data.get('processed_files', {})
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading log file {log_file}: {e}")
-            return {}
-    
-    def _save_processed_file_entry(self, log_file: Path, filename: str, status: str, timestamp: str) -> None:
-        """Adds/updates entry in log file."""
-        try:
-            # Load existing log data
-            if log_file.exists():
+        if log_file.exists():
+            try:
                 with open(log_file, 'r', encoding='utf-8') as f:
-                    log_data = json.load(f)
+                    processed.update(json.load(f).get('processed_files', {}))
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading log file {log_file}: {e}")
+
+        jsonl_file = self._get_log_jsonl_path(log_dir)
+        if jsonl_file.exists():
+            try:
+                with open(jsonl_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if entry.get('filename'):
+                            processed[entry['filename']] = entry
+            except IOError as e:
+                print(f"Error loading log file {jsonl_file}: {e}")
+
+        return processed
+
+    def _write_consolidated_log(self, log_file: Path, processed_files: Dict[str, Dict]) -> None:
+        """Writes the consolidated summary JSON once per run."""
+        try:
+            if orjson is not None:
+                log_file.write_bytes(
+                    orjson.dumps({'processed_files': processed_files}, option=orjson.OPT_INDENT_2)
+                )
             else:
-                log_data = {'processed_files': {}}
-            
-            # Update entry
-            log_data.setdefault('processed_files', {})[filename] = {
-                'filename': filename,
-                'timestamp': timestamp,
-                'status': status
-            }
-            
-            # Save updated log
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error saving log entry for {filename}: {e}")
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    json.dump({'processed_files': processed_files}, f, indent=2, ensure_ascii=False)
+        except IOError as e:
+            print(f"Error saving log file {log_file}: {e}")
     
     def _is_file_processed(self, log_data: Dict[str, Dict], filename: str) -> bool:
         """Checks if file is already in log."""
@@ -266,46 +372,20 @@ class CochraneProcessingPipeline:
         """Save processed document to JSON file."""
         output_file = output_dir / f"processed_{filename}.json"
         
-        # Convert document to dictionary for JSON serialization
-        doc_dict = {
-            'metadata': {
-                'source_file': document.metadata.source_file,
-                'title': document.metadata.title,
-                'doi': document.metadata.doi,
-                'authors': document.metadata.authors,
-                'url': document.metadata.url,
-                'topic_name': document.metadata.topic_name,
-                'quality_grade': document.metadata.quality_grade.value,
-                'extraction_date': document.metadata.extraction_date,
-                'content_length': document.metadata.content_length,
-                'pico_elements': {
-                    'population': document.metadata.pico_elements.population,
-                    'intervention': document.metadata.pico_elements.intervention,
-                    'comparison': document.metadata.pico_elements.comparison,
-                    'outcome': document.metadata.pico_elements.outcome
-                },
-                'medical_entities': {
-                    'conditions': document.metadata.medical_entities.conditions,
-                    'drugs': document.metadata.medical_entities.drugs,
-                    'procedures': document.metadata.medical_entities.procedures,
-                    'outcomes': document.metadata.medical_entities.outcomes
-                },
-                'sections_extracted': document.metadata.sections_extracted,
-                'section_count': document.metadata.section_count,
-                'subsection_count': document.metadata.subsection_count
-            },
-            'sections': {
-                name: {
-                    'name': section.name,
-                    'content': section.content,
-                    'subsections': section.subsections
-                }
-                for name, section in document.sections.sections.items()
-            }
-        }
+        # Convert document to dictionary in one recursive walk instead of
+        # reading every attribute by hand
+        doc_dict = asdict(document)
+        doc_dict['metadata']['quality_grade'] = document.metadata.quality_grade.value
+        # Keep the on-disk layout the indexing reader expects: sections as
+        # a flat name -> section mapping at the top level
+        doc_dict['sections'] = doc_dict['sections']['sections']
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(doc_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(doc_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(doc_dict, f, indent=2, ensure_ascii=False)
     
     def _update_stats(self, result: ProcessingResult):
         """Update processing statistics."""
@@ -359,8 +439,8 @@ class CochraneProcessingPipeline:
     
     def _count_issue_types(self, issues: List[str]) -> Dict[str, int]:
         """Count occurrences of different issue types."""
-        issue_counts = {}
-        for issue in issues:
-            issue_type = issue.split(':')[0] if ':' in issue else issue
-            issue_counts[issue_type] = issue_counts.get(issue_type, 0) + 1
-        return dict(sorted(issue_counts.items(), key=lambda x: x[1], reverse=True))
+        # partition stops at the first colon without allocating a list;
+        # Counter tallies in C and most_common replaces the Python-level
+        # lambda sort
+        counter = Counter(issue.partition(':')[0] for issue in issues)
+        return dict(counter.most_common())
@@ -5,10 +5,18 @@ This module handles final quality validation of processed documents,
 following single responsibility principle.
 """
 
+from collections import Counter
 from typing import List, Optional
 from src.core.data_models import ProcessedDocument, ProcessingResult, ValidationResult
 
 
+def _bucket(issue: str) -> str:
+    """Issue-type key: the text before the first colon, without the
+    per-string tuple that partition() allocates."""
+    i = issue.find(':')
+    return issue if i < 0 else issue[:i]
+
+
 class QualityValidator:
     """Validates quality of processed documents."""
     
@@ -162,42 +170,51 @@ class ProcessingResultValidator:
             warnings=warnings
         )
     
-    def generate_quality_report(self, results: List[ProcessingResult]) -> dict:
+    def generate_quality_report(self, results: List[ProcessingResult],
+                                validations: Optional[List[ValidationResult]] = None) -> dict:
         """
         Generate a quality report for multiple processing results.
-        
+
         Args:
             results: List of processing results
-            
+            validations: Optional precomputed validation results, aligned
+                with results; their issues are reused instead of the ones
+                carried on the processing results
+
         Returns:
             Dictionary with quality metrics and issues
         """
         total_results = len(results)
         successful_results = sum(1 for r in results if r.success)
         failed_results = total_results - successful_results
-        
-        # Collect all errors and warnings
+
+        # Collect all errors and warnings in one pass. The warnings were
+        # already gathered by the pipeline's quality validation (or the
+        # caller's own validation pass), so nothing is revalidated here
         all_errors = []
         all_warnings = []
-        
-        for result in results:
-            if result.errors:
-                all_errors.extend(result.errors)
-            
-            validation = self.validate_processing_result(result)
-            all_warnings.extend(validation.warnings)
-        
-        # Count error types
-        error_counts = {}
-        for error in all_errors:
-            error_type = error.split(':')[0] if ':' in error else error
-            error_counts[error_type] = error_counts.get(error_type, 0) + 1
-        
-        # Count warning types
-        warning_counts = {}
-        for warning in all_warnings:
-            warning_type = warning.split(':')[0] if ':' in warning else warning
-            warning_counts[warning_type] = warning_counts.get(warning_type, 0) + 1
+
+        for i, result in enumerate(results):
+            validation = validations[i] if validations is not None else None
+            if validation is not None:
+                # validate_processing_result already records the slow
+                # processing warning, so it is not re-added here
+                all_errors.extend(validation.errors)
+                all_warnings.extend(validation.warnings)
+            else:
+                if result.errors:
+                    all_errors.extend(result.errors)
+                if result.warnings:
+                    all_warnings.extend(result.warnings)
+                if result.processing_time > 30.0:  # More than 30 seconds
+                    all_warnings.append(
+                        f"Processing took longer than expected: {result.processing_time:.2f}s"
+                    )
+
+        # Count error and warning types in C via Counter; map keeps the
+        # bucketing loop free of generator-frame overhead
+        error_counts = Counter(map(_bucket, all_errors))
+        warning_counts = Counter(map(_bucket, all_warnings))
         
         return {
             'total_processed': total_results,
@@ -206,8 +223,8 @@ class ProcessingResultValidator:
             'success_rate': successful_results / total_results if total_results > 0 else 0,
             'total_errors': len(all_errors),
             'total_warnings': len(all_warnings),
-            'error_types': error_counts,
-            'warning_types': warning_counts,
-            'common_errors': sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-            'common_warnings': sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            'error_types': dict(error_counts),
+            'warning_types': dict(warning_counts),
+            'common_errors': error_counts.most_common(5),
+            'common_warnings': warning_counts.most_common(5)
         }
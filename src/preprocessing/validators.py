@@ -15,7 +15,11 @@ class FileValidator:
     """Validates raw Cochrane JSON files."""
     
     MIN_ABSTRACT_LENGTH = 100
-    DOI_PATTERN = re.compile(r'^10\.\d{4,}/[^\s]+$')
+    # DOIs are pure ASCII, so re.ASCII keeps \d and \s off the Unicode
+    # property tables
+    DOI_PATTERN = re.compile(r'^10\.\d{4,}/[^\s]+$', re.ASCII)
+    # Enum values frozen once instead of walking the Enum per document
+    _VALID_QUALITY_GRADES = frozenset(g.value for g in QualityGrade)
     
     def validate(self, raw_data: RawCochraneData) -> ValidationResult:
         """
@@ -77,14 +81,16 @@ class FileValidator:
         """Validate field formats and data types."""
         errors = []
         
-        # Validate DOI format
-        if raw_data.doi and not self.DOI_PATTERN.match(raw_data.doi):
+        # Validate DOI format; the prefix check rejects most invalid
+        # DOIs with one string comparison before the regex runs
+        if raw_data.doi and (not raw_data.doi.startswith('10.')
+                             or not self.DOI_PATTERN.match(raw_data.doi)):
             errors.append(f"Invalid DOI format: {raw_data.doi}")
         
         # Validate quality grade
         if raw_data.quality:
             grade = raw_data.quality.get('grade')
-            if grade and grade not in [g.value for g in QualityGrade]:
+            if grade and grade not in self._VALID_QUALITY_GRADES:
                 errors.append(f"Invalid quality grade: {grade}")
         
         # Validate authors list
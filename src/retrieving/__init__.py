@@ -1,39 +1,38 @@
 """Retrieval module for Cochrane RAG system."""
 
-from src.retrieving.retriever import CochraneRetriever, RetrievalResult
-from src.retrieving.query_rewriter import MedicalQueryRewriter, QueryVariant, QueryFusionRetriever
-from src.retrieving.multi_query_retriever import MultiQueryRetriever
-from src.retrieving.reranker import MedicalReranker, ScoredDocument
-from src.retrieving.langchain_retriever import CochraneLangChainRetriever
-from src.retrieving.base_embedder import BaseEmbedder
-from src.retrieving.embedder import OpenAIEmbedder
+# Every export resolves lazily on first attribute access (PEP 562), so
+# `import src.retrieving` pays for none of the heavy dependencies
+# (weaviate, langchain, torch) until the class that needs them is used
+_LAZY_EXPORTS = {
+    "CochraneRetriever": "src.retrieving.retriever",
+    "RetrievalResult": "src.retrieving.retriever",
+    "MedicalQueryRewriter": "src.retrieving.query_rewriter",
+    "QueryVariant": "src.retrieving.query_rewriter",
+    "QueryFusionRetriever": "src.retrieving.query_rewriter",
+    "MultiQueryRetriever": "src.retrieving.multi_query_retriever",
+    "MedicalReranker": "src.retrieving.reranker",
+    "ScoredDocument": "src.retrieving.reranker",
+    "CrossEncoderReranker": "src.retrieving.cross_encoder_reranker",
+    "HybridReranker": "src.retrieving.cross_encoder_reranker",
+    "CochraneLangChainRetriever": "src.retrieving.langchain_retriever",
+    "BaseEmbedder": "src.retrieving.base_embedder",
+    "OpenAIEmbedder": "src.retrieving.embedder",
+    "MedCPTEmbedder": "src.retrieving.medcpt_embedder",
+    "BioLORDEmbedder": "src.retrieving.biolord_embedder",
+    "get_embedder": "src.retrieving.embedder_factory",
+}
+
 
 def __getattr__(name):
-    if name == "MedCPTEmbedder":
-        from src.retrieving.medcpt_embedder import MedCPTEmbedder
-        return MedCPTEmbedder
-    elif name == "BioLORDEmbedder":
-        from src.retrieving.biolord_embedder import BioLORDEmbedder
-        return BioLORDEmbedder
-    elif name == "get_embedder":
-        from src.retrieving.embedder_factory import get_embedder
-        return get_embedder
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-__all__ = [
-    "CochraneRetriever",
-    "RetrievalResult",
-    "MedicalQueryRewriter",
-    "QueryVariant",
-    "QueryFusionRetriever",
-    "MultiQueryRetriever",
-    "MedicalReranker",
-    "ScoredDocument",
-    "CochraneLangChainRetriever",
-    "BaseEmbedder",
-    "OpenAIEmbedder",
-    "MedCPTEmbedder",
-    "BioLORDEmbedder",
-    "get_embedder",
-]
 
+__all__ = list(_LAZY_EXPORTS)
@@ -1,21 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class BaseEmbedder(ABC):
-    
+
     @abstractmethod
-    def encode(self, text: str) -> List[float]:
+    def encode(self, text: str) -> "np.ndarray":
         pass
-    
+
     @abstractmethod
-    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+    def encode_batch(self, texts: List[str]) -> "np.ndarray":
         pass
-    
+
     @abstractmethod
     def get_dimension(self) -> int:
         pass
-    
+
     @abstractmethod
     def get_model_name(self) -> str:
         pass
@@ -5,10 +5,12 @@ Uses HuggingFace Inference API for cross-encoder models.
 Falls back gracefully if API key is not available.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 import warnings
 import os
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 
 class CrossEncoderReranker:
@@ -37,8 +39,28 @@ class CrossEncoderReranker:
         self.api_key = None
         self.api_url = None
         self.headers = None
+        self.session = None
+        self.local_model = None
 
-        self._init_hf_api()
+        # A local model removes the network round trip entirely; the HF
+        # API is only used when sentence_transformers is unavailable
+        if not self._init_local_model():
+            self._init_hf_api()
+
+    def _init_local_model(self) -> bool:
+        """Try to load the cross-encoder locally; True on success."""
+        try:
+            import torch
+            from sentence_transformers import CrossEncoder
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.local_model = CrossEncoder(self.model_name, device=device)
+            self.available = True
+            print(f"✅ Cross-encoder reranker ready (local, device: {device}): {self.model_name}")
+            return True
+        except Exception:
+            self.local_model = None
+            return False
 
     def _init_hf_api(self):
         """Initialize HuggingFace Inference API for cross-encoder scoring."""
@@ -56,6 +78,21 @@ class CrossEncoderReranker:
                 f"https://api-inference.huggingface.co/models/{self.model_name}"
             )
             self.headers = {"Authorization": f"Bearer {self.api_key}"}
+
+            # One pooled session reused for every request: TCP/TLS
+            # handshakes are paid once per connection rather than per
+            # call, with retries on transient gateway/rate-limit errors
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 502, 503, 504],
+                ),
+            ))
+            self.session.headers.update(self.headers)
             self.available = True
             print(f"✅ Cross-encoder reranker ready (HuggingFace API): {self.model_name}")
 
@@ -80,47 +117,78 @@ class CrossEncoderReranker:
         if not self.available:
             return self._fallback_rerank(documents, top_k)
 
+        if self.local_model is not None:
+            return self._rerank_local(query, documents, top_k)
+
         return self._rerank_hf_api(query, documents, top_k)
 
+    def _rerank_local(
+        self, query: str, documents: List[Dict[str, Any]], top_k: Optional[int]
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Re-rank with the local model: one batched forward pass."""
+        pairs = [(query, doc.get("page_content", "")[:512]) for doc in documents]
+
+        try:
+            scores = self.local_model.predict(
+                pairs, batch_size=32, convert_to_numpy=True, show_progress_bar=False
+            )
+        except Exception as e:
+            warnings.warn(f"Local cross-encoder error: {e}")
+            return self._fallback_rerank(documents, top_k)
+
+        scored_docs = [(doc, float(score)) for doc, score in zip(documents, scores)]
+
+        # Sort by score (descending)
+        scored_docs.sort(key=lambda x: x[1], reverse=True)
+
+        if top_k:
+            return scored_docs[:top_k]
+
+        return scored_docs
+
+    # Documents scored per API request; the sentence-similarity pipeline
+    # accepts a list, so one POST replaces one round trip per document
+    API_BATCH_SIZE = 30
+
     def _rerank_hf_api(
         self, query: str, documents: List[Dict[str, Any]], top_k: Optional[int]
     ) -> List[Tuple[Dict[str, Any], float]]:
         """Re-rank using HuggingFace Inference API."""
         scored_docs = []
 
-        for doc in documents:
-            content = doc.get("page_content", "")
+        for start in range(0, len(documents), self.API_BATCH_SIZE):
+            batch = documents[start:start + self.API_BATCH_SIZE]
 
             # Truncate very long documents
-            if len(content) > 2000:
-                content = content[:2000]
+            contents = [doc.get("page_content", "")[:2000] for doc in batch]
 
             try:
-                # Cross-encoder scoring via HF API
-                response = requests.post(
+                # Cross-encoder scoring via HF API, one call per batch
+                response = self.session.post(
                     self.api_url,
-                    headers=self.headers,
                     json={
-                        "inputs": {"source_sentence": query, "sentences": [content]},
+                        "inputs": {"source_sentence": query, "sentences": contents},
                         "options": {"wait_for_model": True},
                     },
-                    timeout=10,
+                    timeout=30,
                 )
 
-                if response.status_code == 200:
-                    scores = response.json()
-                    score = scores[0] if isinstance(scores, list) else 0.5
-                else:
-                    # Fallback to metadata score
-                    score = doc.get("metadata", {}).get("relevance_score", 0.5)
-
-                scored_docs.append((doc, float(score)))
+                scores = response.json() if response.status_code == 200 else None
+                if not isinstance(scores, list) or len(scores) != len(batch):
+                    scores = None
 
             except Exception as e:
                 warnings.warn(f"Cross-encoder API error: {e}")
-                # Use fallback score
-                score = doc.get("metadata", {}).get("relevance_score", 0.5)
-                scored_docs.append((doc, float(score)))
+                scores = None
+
+            if scores is not None:
+                for doc, score in zip(batch, scores):
+                    scored_docs.append((doc, float(score)))
+            else:
+                # Some checkpoints reject sentence lists; retry the
+                # batch with one request per document, in parallel so
+                # the round trips overlap
+                scored_docs.extend(self._score_individually(query, batch))
 
         # Sort by score (descending)
         scored_docs.sort(key=lambda x: x[1], reverse=True)
@@ -130,6 +198,35 @@ class CrossEncoderReranker:
 
         return scored_docs
 
+    def _score_individually(
+        self, query: str, documents: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Score documents one request each, overlapped across threads."""
+
+        def _score(doc):
+            content = doc.get("page_content", "")[:2000]
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    json={
+                        "inputs": {"source_sentence": query, "sentences": [content]},
+                        "options": {"wait_for_model": True},
+                    },
+                    timeout=10,
+                )
+                if response.status_code == 200:
+                    scores = response.json()
+                    if isinstance(scores, list) and scores:
+                        return doc, float(scores[0])
+            except Exception as e:
+                warnings.warn(f"Cross-encoder API error: {e}")
+
+            # Fallback to metadata score
+            return doc, float(doc.get("metadata", {}).get("relevance_score", 0.5))
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            return list(executor.map(_score, documents))
+
     def _fallback_rerank(
         self, documents: List[Dict[str, Any]], top_k: Optional[int]
     ) -> List[Tuple[Dict[str, Any], float]]:
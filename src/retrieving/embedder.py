@@ -1,7 +1,10 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 import os
 from src.retrieving.base_embedder import BaseEmbedder
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class OpenAIEmbedder(BaseEmbedder):
     
@@ -18,17 +21,19 @@ class OpenAIEmbedder(BaseEmbedder):
         except ImportError:
             raise ImportError("openai package not installed. Install with: pip install openai")
     
-    def encode(self, text: str) -> List[float]:
+    def encode(self, text: str) -> "np.ndarray":
+        import numpy as np
         try:
             response = self.client.embeddings.create(model=self.model_name, input=text)
-            return response.data[0].embedding
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {e}")
-    
-    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+
+    def encode_batch(self, texts: List[str]) -> "np.ndarray":
+        import numpy as np
         try:
             response = self.client.embeddings.create(model=self.model_name, input=texts)
-            return [item.embedding for item in response.data]
+            return np.asarray([item.embedding for item in response.data], dtype=np.float32)
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {e}")
     
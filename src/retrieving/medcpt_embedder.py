@@ -1,17 +1,23 @@
-from typing import List
-import torch
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, List
 from src.retrieving.base_embedder import BaseEmbedder
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class MedCPTEmbedder(BaseEmbedder):
-    
+
     def __init__(
         self,
         query_model: str = "ncbi/MedCPT-Query-Encoder",
         article_model: str = "ncbi/MedCPT-Article-Encoder",
         device: str = None
     ):
+        # Deferred so importing this module stays cheap; torch and the
+        # CUDA stack only load when an embedder is actually constructed
+        import torch
+        from sentence_transformers import SentenceTransformer
+
         self.query_model_name = query_model
         self.article_model_name = article_model
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
@@ -27,15 +33,13 @@ class MedCPTEmbedder(BaseEmbedder):
             raise ValueError("Mode must be 'query' or 'article'")
         self.current_mode = mode
     
-    def encode(self, text: str) -> List[float]:
+    def encode(self, text: str) -> "np.ndarray":
         encoder = self.query_encoder if self.current_mode == "query" else self.article_encoder
-        embedding = encoder.encode(text, convert_to_tensor=False, show_progress_bar=False)
-        return embedding.tolist()
-    
-    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        return encoder.encode(text, convert_to_tensor=False, show_progress_bar=False)
+
+    def encode_batch(self, texts: List[str]) -> "np.ndarray":
         encoder = self.query_encoder if self.current_mode == "query" else self.article_encoder
-        embeddings = encoder.encode(texts, convert_to_tensor=False, show_progress_bar=False)
-        return embeddings.tolist()
+        return encoder.encode(texts, convert_to_tensor=False, show_progress_bar=False)
     
     def get_dimension(self) -> int:
         return 768